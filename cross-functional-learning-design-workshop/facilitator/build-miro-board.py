@@ -1,37 +1,104 @@
 #!/usr/bin/env python3
 """
-Build the workshop Miro board from the miro-playbook.md specification.
+Build the workshop Miro board from board-spec.json, and keep built boards in step with it.
 
 Requires: MIRO_ACCESS_TOKEN in the environment (and optionally MIRO_TEAM_ID).
-Install: pip install requests
+Install: pip install requests (miro.py, alongside this script, holds the API client)
 
 Usage:
   export MIRO_ACCESS_TOKEN="your_token"
   python build-miro-board.py
+  python build-miro-board.py build --resume   # finish a build that stopped part way
+  python build-miro-board.py sync             # push spec edits to the board in the journal
+  python build-miro-board.py sync cohort-a.jsonl cohort-b.jsonl
+  python build-miro-board.py reset            # clear participants' notes for the next cohort
+  python build-miro-board.py build-many cohorts.csv   # one board per roster row
+  python build-miro-board.py bench                    # time a build against standin.py
+  python build-miro-board.py preview                  # render miro-preview.html, no token needed
+  python build-miro-board.py export miro-board-journal.jsonl   # archive a board to JSONL
+  python build-miro-board.py harvest miro-board-journal.jsonl  # collect new sticky notes
 
 Creates a new board with 9 zones (Landing + Phases 1–7 + Break), frames, prompts,
-sticky note areas, and the Redesign Map template. After running, open the board
-URL printed at the end; duplicate the Phase 5 Redesign Map template once per team
-and add participant names to the Landing zone sticky notes.
+sticky note areas, and one Redesign Map per team in Phase 5 (the Phase 5 frame widens
+to fit NUM_TEAMS maps). After running, open the board URL printed at the end and add
+participant names to the Landing zone sticky notes.
+
+Board content lives in board-spec.json. It is compiled into a flat plan in which every
+frame and item has a stable key ("phase-1", "phase-1/definition", "landing/names.3").
+Edit the spec, not this script, to change wording, positions or colours.
+Spec coordinates are preferred positions, not fixed ones: layout.py sizes each item from
+its content, moves an element down if it would overlap one placed before it, spaces
+repeats and sticky grids by their real extent, stretches a shape over the items its
+"covers" names, and grows each frame to fit.
+
+Frames are created first; their contents are then created concurrently, with at most
+MAX_WORKERS requests in flight. Raise or lower it in the config block below. Sticky
+notes, and everything in a repeat the spec marks "bulk", go out BULK_LIMIT per call
+through Miro's bulk create, so a zone's sticky grids cost a handful of calls however
+many notes they hold.
+Every created item is appended to a local journal (miro-board-journal.jsonl) with its
+key and a hash of its content. If a build fails, `build --resume` reuses that board and
+creates only the missing items. `sync` reads a board's journal, lists what is still on
+the board and sends only the creates, updates and deletes needed to match the spec.
+`build-many` builds one board per cohort in a roster CSV, BOARDS_IN_FLIGHT at a time,
+with every request drawing on one shared rate budget; each board gets its own journal
+in miro-board-journals/.
+
+`reset` readies a used board for the next cohort in far fewer calls than a rebuild: it
+deletes sticky notes participants added inside the frames, clears the pre-placed ones
+back to their spec content and position, and puts the dark cover shapes back. Prompts
+are not touched.
+
+`export` streams every item on one or more boards to miro-exports/<board id>.jsonl,
+frame by frame, labelling each item with the spec zone (phase) its frame belongs to.
+
+`harvest` appends the sticky notes written in the zones the spec marks "harvest"
+(Phase 1 definitions, Phase 6 critiques, Phase 7 commitments) to miro-harvest.jsonl,
+tagged with phase and role colour. It remembers what it has seen, so a rerun only
+appends new or edited notes.
+
+Every API call is traced (tracing.py). build, sync, reset and build-many end with
+per-zone and per-endpoint latency tables and write miro-run-report.json; `--spans`
+also appends the calls as OpenTelemetry spans.
+
+`preview` runs the same build against preview.py's in-memory board instead of Miro and
+writes the result as a zoomable HTML page (or SVG), to check wording and layout changes
+in the spec without creating a board.
+
+Set MIRO_API_BASE to point any command at another server, such as the local stand-in
+in standin.py. `bench` starts that stand-in itself and times full builds at several
+sizes, so concurrency and rate limiting can be tuned without touching real boards.
 
 See miro-playbook.md for facilitation and manual steps (timer, covering shapes,
-lock/unlock, duplicate template per team).
+lock/unlock).
 """
 
+import argparse
+import ast
+import contextlib
+import csv
+import hashlib
+import io
+import itertools
+import json
+import math
+import operator
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-try:
-    import requests
-except ImportError:
-    print("Install requests: pip install requests", file=sys.stderr)
-    sys.exit(1)
+import layout
+from miro import BASE, BULK_LIMIT, RATE_LIMIT_CREDITS, MiroClient, RateLimiter, item_body, plain_text
+from tracing import Trace
 
 # -----------------------------------------------------------------------------
 # Config (edit before running if needed)
 # -----------------------------------------------------------------------------
-BOARD_NAME = "Designing Learning as a Cross-Functional Activity System — Workshop"
 FRAME_WIDTH = 1600
 FRAME_HEIGHT = 1400
 FRAME_GAP = 200
@@ -47,11 +114,39 @@ COLOR_LEARNING_TECH = "orange"
 # Dark cover for reveals
 FILL_DARK = "#111111"
 FILL_LIGHT_ZONE = "#f5f5f5"
+# Requests in flight at once while filling frames (frames themselves are created first).
+# Also the size of the client's keep-alive connection pool.
+MAX_WORKERS = 8
+# Boards built at once by build-many. All of them share one client and one rate budget,
+# so this mostly helps while the budget has room; each board still uses MAX_WORKERS.
+BOARDS_IN_FLIGHT = 4
+# Board content, and the local record of built items used by --resume and sync
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "board-spec.json")
+JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-board-journal.jsonl")
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-board-journals")
+# Where export writes one <board id>.jsonl per board
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-exports")
+# Pages (50 items each) fetched ahead per frame while export writes the frame before it
+PREFETCH_PAGES = 4
+# harvest: the dataset it appends sticky notes to, and its record of what it has already seen
+HARVEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-harvest.jsonl")
+HARVEST_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-harvest-state.json")
+# Where preview writes the rendered board (.html, or .svg for the bare drawing)
+PREVIEW_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-preview.html")
+# Run report written after build, sync, reset and build-many (overwritten each run; see tracing.py)
+REPORT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "miro-run-report.json")
 
-BASE = "https://api.miro.com/v2"
+# Spec colour names: role keys and zone fills
+ROLE_COLORS = {
+    "curriculum": COLOR_CURRICULUM,
+    "learning_design": COLOR_LEARNING_DESIGN,
+    "multimedia": COLOR_MULTIMEDIA,
+    "learning_tech": COLOR_LEARNING_TECH,
+}
+NAMED_FILLS = {"dark": FILL_DARK, "light": FILL_LIGHT_ZONE}
 
 # -----------------------------------------------------------------------------
-# API helpers
+# API helpers (transport, rate limiting and retries live in miro.py)
 # -----------------------------------------------------------------------------
 def get_token():
     t = os.environ.get("MIRO_ACCESS_TOKEN", "").strip()
@@ -61,335 +156,986 @@ def get_token():
     return t
 
 
-def headers(token):
-    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-
-def create_board(token):
-    body = {"name": BOARD_NAME[:60], "description": "135-minute cross-functional learning design workshop. See facilitator miro-playbook."}
-    team_id = os.environ.get("MIRO_TEAM_ID", "").strip()
-    if team_id:
-        body["teamId"] = team_id
-    r = requests.post(f"{BASE}/boards", json=body, headers=headers(token), timeout=30)
-    r.raise_for_status()
-    data = r.json()
-    return data["id"]
-
-
-def create_frame(token, board_id, title, x, y, width=FRAME_WIDTH, height=FRAME_HEIGHT, fill_color=None):
-    body = {
-        "data": {"title": title[:6000], "format": "custom", "type": "freeform"},
-        "position": {"x": x, "y": y},
-        "geometry": {"width": width, "height": height},
-    }
-    if fill_color:
-        body["style"] = {"fillColor": fill_color}
-    r = requests.post(f"{BASE}/boards/{board_id}/frames", json=body, headers=headers(token), timeout=30)
-    r.raise_for_status()
-    return r.json()["id"]
-
-
-def create_text(token, board_id, content, x, y, parent_id=None, width=400, font_size=14, color="#1a1a1a", fill_color=None):
-    pos = {"x": x, "y": y}
-    if parent_id:
-        pos["relativeTo"] = "parent_top_left"
-    body = {
-        "data": {"content": content[:65000]},
-        "position": pos,
-        "geometry": {"width": width},
-        "style": {"fontSize": str(font_size), "color": color},
-    }
-    if fill_color:
-        body["style"]["fillColor"] = fill_color
-        body["style"]["fillOpacity"] = "1.0"
-    if parent_id:
-        body["parent"] = {"id": str(parent_id)}
-    r = requests.post(f"{BASE}/boards/{board_id}/texts", json=body, headers=headers(token), timeout=30)
-    r.raise_for_status()
-    return r.json()["id"]
-
-
-def create_sticky(token, board_id, content, x, y, parent_id=None, fill_color="light_yellow", width=200):
-    pos = {"x": x, "y": y}
-    if parent_id:
-        pos["relativeTo"] = "parent_top_left"
-    body = {
-        "data": {"content": content[:65000], "shape": "rectangle"},
-        "position": pos,
-        "geometry": {"width": width},
-        "style": {"fillColor": fill_color},
-    }
-    if parent_id:
-        body["parent"] = {"id": str(parent_id)}
-    r = requests.post(f"{BASE}/boards/{board_id}/sticky_notes", json=body, headers=headers(token), timeout=30)
-    r.raise_for_status()
-    return r.json()["id"]
-
-
-def create_shape(token, board_id, x, y, width, height, parent_id=None, fill_color="#ffffff", content=""):
-    pos = {"x": x, "y": y}
-    if parent_id:
-        pos["relativeTo"] = "parent_top_left"
-    body = {
-        "data": {"shape": "rectangle", "content": content},
-        "position": pos,
-        "geometry": {"width": width, "height": height},
-        "style": {"fillColor": fill_color},
-    }
-    if parent_id:
-        body["parent"] = {"id": str(parent_id)}
-    r = requests.post(f"{BASE}/boards/{board_id}/shapes", json=body, headers=headers(token), timeout=30)
-    r.raise_for_status()
-    return r.json()["id"]
-
-
-def _rate_limit():
-    time.sleep(0.15)
+def open_client(pool_size=MAX_WORKERS, trace=None):
+    return MiroClient(get_token(), base=os.environ.get("MIRO_API_BASE", "").strip() or BASE, pool_size=pool_size, trace=trace)
+
+
+# -----------------------------------------------------------------------------
+# Board spec -> item plan
+# -----------------------------------------------------------------------------
+# Plan item fields that are bookkeeping rather than board content
+PLAN_META = ("key", "zone", "layer", "bulk", "overlay")
+
+
+def load_spec(path=SPEC_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# What spec expressions may use besides numbers and the names in the plan's env
+SPEC_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.FloorDiv: operator.floordiv}
+SPEC_FUNCTIONS = {"min": min, "max": max}
+
+
+def _number(value, env):
+    """Spec numbers may be expressions such as "min(8, participants)" or "80 + teams * 320":
+    numbers, names from `env`, + - * // and min()/max(). They are evaluated, not run."""
+    if not isinstance(value, str):
+        return value
+    try:
+        tree = ast.parse(value, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"spec expression {value!r} is not valid") from None
+    return _evaluate(tree.body, value, env)
+
+
+def _evaluate(node, text, env):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in env:
+            raise ValueError(f"spec expression {text!r}: unknown name {node.id!r} (known: {', '.join(sorted(env))})")
+        return env[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in SPEC_OPERATORS:
+        return SPEC_OPERATORS[type(node.op)](_evaluate(node.left, text, env), _evaluate(node.right, text, env))
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in SPEC_FUNCTIONS
+            and node.args and not node.keywords):
+        return SPEC_FUNCTIONS[node.func.id](*(_evaluate(arg, text, env) for arg in node.args))
+    raise ValueError(f"spec expression {text!r}: {ast.unparse(node)!r} is not allowed "
+                     f"(only numbers, names, + - * // and min/max)")
+
+
+def _fill(text, names):
+    """Substitute {name} placeholders from a repeat row; other braces are left alone."""
+    for name, value in names.items():
+        text = text.replace(f"{{{name}}}", str(value))
+    return text
+
+
+def _color(value):
+    return ROLE_COLORS.get(value) or NAMED_FILLS.get(value, value)
+
+
+def _add(ctx, key, item):
+    # Miro stacks items in creation order: a dark cover must land on top of the text it
+    # hides, and white text on top of its dark band. Each shape therefore gets a layer of
+    # its own; items within a layer are independent and may be created concurrently.
+    # Sticky notes (grids, role columns) are the bulk of every zone and always alike, so
+    # they are always bulk-created; other items only inside a repeat marked "bulk".
+    if item["type"] == "shape":
+        ctx["layer"] += 1
+        layer = ctx["layer"]
+        ctx["layer"] += 1
+    else:
+        layer = ctx["layer"]
+    bulk = ctx["bulk"] or item["type"] == "sticky_note"
+    item = layout.measure(dict(item, key=key, zone=ctx["zone"], layer=layer, bulk=bulk))
+    ctx["items"].append(item)
+    return item
+
+
+def _compile_items(elements, prefix, names, ctx):
+    """Compile spec `elements` into plan items in their container's coordinates.
+
+    Each element goes where the spec puts it unless it would overlap an element placed
+    before it; then it moves down just far enough (layout.Flow). Shapes with "covers"
+    are overlays: they stretch over the elements they name, and the cover and what it
+    covers are laid out together first, then placed as one block, so later elements
+    keep clear of the cover as well. Returns the items, in creation order.
+    """
+    compiled, declared, group = {}, {}, {}
+    for el in elements:
+        compiled[el["id"]] = _compile_element(el, f"{prefix}/{el['id']}", names, ctx)
+        declared[el["id"]] = layout.bounds(compiled[el["id"]])
+        group[el["id"]] = el["id"]
+
+    def root(el_id):
+        while group[el_id] != el_id:
+            el_id = group[el_id]
+        return el_id
+
+    covers = [el for el in elements if el["type"] == "shape" and el.get("covers")]
+    for el in covers:
+        compiled[el["id"]][0]["overlay"] = True
+        for covered in el["covers"]:
+            group[root(covered)] = root(el["id"])
+
+    flow, done = layout.Flow(), set()
+    for el in elements:
+        if root(el["id"]) in done:
+            continue
+        done.add(root(el["id"]))
+        members = [m for m in elements if root(m["id"]) == root(el["id"])]
+        inner = layout.Flow()
+        for m in members:
+            if m not in covers:
+                inner.place(compiled[m["id"]])
+        pending = [m for m in members if m in covers]
+        while pending:  # a cover over another cover is fitted after it
+            waiting = {m["id"] for m in pending}
+            ready = [m for m in pending if not waiting & set(m["covers"])]
+            if not ready:
+                raise ValueError(f"{prefix}: shapes cover each other in a loop")
+            for m in ready:
+                layout.fit_cover(compiled[m["id"]][0], declared[m["id"]], [declared[c] for c in m["covers"]],
+                                 [layout.bounds(compiled[c]) for c in m["covers"]])
+                pending.remove(m)
+        flow.place([item for m in members for item in compiled[m["id"]]])
+    return [item for el in elements for item in compiled[el["id"]]]
+
+
+def _pitch(declared, size):
+    """Spacing between repeated cells: the spec's spacing, or more if the cells would touch."""
+    return max(declared, size + layout.GAP)
+
+
+def _compile_element(el, key, names, ctx):
+    env = ctx["env"]
+    kind = el["type"]
+    x = _number(el.get("x", 0), env)
+    y = _number(el.get("y", 0), env)
+    if kind == "repeat":
+        rows = el.get("over") or [{} for _ in range(_number(el["count"], env))]
+        outer_bulk = ctx["bulk"]
+        ctx["bulk"] = outer_bulk or el.get("bulk", False)
+        blocks = []
+        for k, row in enumerate(rows):
+            row_names = dict(names, n=k + 1, **row)
+            if "role" in row:
+                row_names["role_name"] = ctx["roles"][row["role"]]
+            blocks.append(_compile_items(el["items"], f"{key}.{k + 1}", row_names, ctx))
+        ctx["bulk"] = outer_bulk
+        # Rows are laid out across when the spec spaces them with dx, otherwise down
+        across = bool(el.get("dx"))
+        extents = [(b[2] - b[0]) if across else (b[3] - b[1]) for b in map(layout.bounds, blocks) if b]
+        pitch = _pitch(el.get("dx" if across else "dy", 0), max(extents, default=0))
+        for k, block in enumerate(blocks):
+            layout.shift(block, dx=k * pitch if across else 0, dy=0 if across else k * pitch)
+        return [item for block in blocks for item in block]
+    if kind == "sticky_grid":
+        colors = el.get("colors", ["light_yellow"])
+        if colors == "roles":
+            colors = list(ctx["roles"])
+        width = el.get("width", 200)
+        pitch_x = _pitch(el.get("dx", 0), width)
+        pitch_y = _pitch(el.get("dy", 0), math.ceil(width * layout.STICKY_HEIGHT_RATIO))
+        cols = el["cols"]
+        if cols == "auto":  # as many as fit across the frame
+            cols = max(1, (ctx["frame_width"] - x - layout.MARGIN + layout.GAP) // pitch_x)
+        items = []
+        for i in range(_number(el["count"], env)):
+            row, col = divmod(i, cols)
+            items.append(_add(ctx, f"{key}.{i + 1}", {
+                "type": "sticky_note", "x": x + col * pitch_x, "y": y + row * pitch_y,
+                "width": width, "content": _fill(el.get("content", ""), names),
+                "fill_color": _color(_fill(colors[i % len(colors)], names)),
+            }))
+        return items
+    if kind == "sticky":
+        return [_add(ctx, key, {
+            "type": "sticky_note", "x": x, "y": y, "width": el.get("width", 200),
+            "content": _fill(el.get("content", ""), names),
+            "fill_color": _color(_fill(el.get("color", "light_yellow"), names)),
+        })]
+    if kind == "text":
+        return [_add(ctx, key, {
+            "type": "text", "x": x, "y": y, "width": _number(el.get("width", 400), env),
+            "content": _fill(el["content"], names), "font_size": el.get("font_size", 14),
+            "color": el.get("color", "#1a1a1a"),
+        })]
+    if kind == "shape":
+        return [_add(ctx, key, {
+            "type": "shape", "x": x, "y": y, "width": _number(el["width"], env),
+            "height": _number(el["height"], env), "fill_color": _color(el.get("fill", "#ffffff")),
+            "content": _fill(el.get("content", ""), names),
+        })]
+    raise ValueError(f"{key}: unknown spec item type {kind!r}")
+
+
+def compile_plan(spec, participants=NUM_PARTICIPANT_SLOTS, teams=NUM_TEAMS):
+    """Flatten and lay out the board spec into frames and items with stable keys.
+
+    Returns {"board": {...}, "zones": [...], "items": [...]}. Zones are frame items laid
+    out left to right, FRAME_GAP apart, with their tops aligned; each frame is at least
+    FRAME_WIDTH x FRAME_HEIGHT (or the zone's own "width") and grows to fit its contents.
+    Every item carries its "key", its "zone" key, a z-order "layer", a "bulk" flag (items
+    from a repeat marked "bulk" may be created in bulk calls), an "overlay" flag on cover
+    shapes, and the fields miro.item_body expects, with x/y the top-left corner within
+    its frame. No two items other than overlays overlap (see layout.py); a layout that
+    leaves any overlapping raises ValueError rather than build a cluttered board.
+    """
+    env = {"participants": participants, "teams": teams, "frame_width": FRAME_WIDTH, "frame_height": FRAME_HEIGHT}
+    sizes, items = [], []
+    for zone in spec["zones"]:
+        min_width = _number(zone.get("width", FRAME_WIDTH), env)
+        ctx = {"env": env, "roles": spec.get("roles", {}), "zone": zone["key"], "layer": 0, "bulk": False,
+               "frame_width": min_width, "items": items}
+        zone_items = _compile_items(zone["items"], zone["key"], {}, ctx)
+        clashes = layout.overlaps(zone_items)
+        if clashes:
+            raise ValueError(f"{zone['key']}: layout left items overlapping: "
+                             + ", ".join(f"{a['key']} and {b['key']}" for a, b in clashes[:5]))
+        # Covers may reach the frame edge (full-width bands); everything else keeps a margin
+        solid = layout.bounds([i for i in zone_items if not i.get("overlay")]) or (0, 0, 0, 0)
+        box = layout.bounds(zone_items) or solid
+        sizes.append((max(min_width, solid[2] + layout.MARGIN, box[2]), max(FRAME_HEIGHT, solid[3] + layout.MARGIN, box[3])))
+
+    # Same centres as equal-width frames would have; wider frames push later ones right
+    left = -(len(sizes) // 2) * (FRAME_WIDTH + FRAME_GAP) - sizes[0][0] // 2
+    zones = []
+    for zone, (width, height) in zip(spec["zones"], sizes):
+        zones.append({
+            "key": zone["key"], "type": "frame", "title": zone["title"],
+            "x": left + width // 2, "y": (height - FRAME_HEIGHT) // 2, "width": width, "height": height,
+            "fill_color": _color(zone.get("fill", "light")),
+        })
+        left += width + FRAME_GAP
+    return {"board": spec["board"], "zones": zones, "items": items}
+
+
+def item_hash(item):
+    """Content hash of a plan item, ignoring its bookkeeping fields."""
+    content = {k: v for k, v in item.items() if k not in PLAN_META}
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()[:16]
 
 
 # -----------------------------------------------------------------------------
-# Zone builders (position relative to frame top-left)
+# Build engine
 # -----------------------------------------------------------------------------
-def build_landing(token, board_id, frame_id):
-    create_text(token, board_id, "Designing Learning as a Cross-Functional Activity System", 80, 40, frame_id, width=800, font_size=24)
-    create_text(token, board_id, "Facilitator: [Your name]\nDate: [Session date]", 80, 120, frame_id, width=400, font_size=12)
-    create_text(token, board_id, "Zoom out to see the full board. We will move left to right through the phases. Start here and wait for the facilitator.", 80, 220, frame_id, width=700, font_size=12)
-    create_text(token, board_id, "Find your name below (colour = your role). Click your note to confirm you can edit.", 80, 320, frame_id, width=600, font_size=12)
-    # Participant name sticky notes (mix of role colours)
-    colors = [COLOR_CURRICULUM, COLOR_LEARNING_DESIGN, COLOR_MULTIMEDIA, COLOR_LEARNING_TECH]
-    for i in range(NUM_PARTICIPANT_SLOTS):
-        row, col = divmod(i, 4)
-        create_sticky(token, board_id, "Name", 100 + col * 220, 400 + row * 120, frame_id, fill_color=colors[i % 4], width=200)
-        _rate_limit()
-
-
-def build_phase1(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 1 — Framing the Shared Object", 80, 30, frame_id, width=600, font_size=18)
-    create_text(token, board_id, "Define learning in one sentence.", 80, 80, frame_id, width=500, font_size=16)
-    for i in range(min(8, NUM_PARTICIPANT_SLOTS)):
-        row, col = divmod(i, 4)
-        create_sticky(token, board_id, "", 80 + col * 220, 140 + row * 110, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-    create_text(token, board_id, "How do you know when learning has happened?", 80, 480, frame_id, width=500, font_size=16)
-    for i in range(min(8, NUM_PARTICIPANT_SLOTS)):
-        row, col = divmod(i, 4)
-        create_sticky(token, board_id, "", 80 + col * 220, 540 + row * 110, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-    # Definition (covered — create dark shape on top; facilitator deletes to reveal)
-    create_text(token, board_id, "Learning is durable change in knowledge structures that enables future participation and performance.", 80, 920, frame_id, width=500, font_size=14)
-    create_shape(token, board_id, 70, 900, 520, 80, frame_id, fill_color=FILL_DARK)
-    create_text(token, board_id, "Durable — Not fleeting. Visible months later.\nKnowledge structures — Organised schemas in long-term memory.\nEnables future — The test is what learners can do later.", 620, 900, frame_id, width=400, font_size=12)
-    create_text(token, board_id, "1. What must learners be able to do 6–12 months from now, in real conditions?", 80, 1020, frame_id, width=700, font_size=12)
-    create_text(token, board_id, "2. What cognitive change must occur for that to be possible?", 80, 1100, frame_id, width=700, font_size=12)
-    for i in range(4):
-        create_sticky(token, board_id, "", 80 + (i % 4) * 220, 1180, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-
-
-def build_phase2(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 2 — Learning Science Core", 80, 30, frame_id, width=600, font_size=18)
-    create_shape(token, board_id, 0, 0, FRAME_WIDTH, 320, frame_id, fill_color=FILL_DARK)
-    create_text(token, board_id, "Close your notes. Write the three commitments from memory.", 80, 100, frame_id, width=600, font_size=16, color="#ffffff")
-    for i in range(min(8, NUM_PARTICIPANT_SLOTS)):
-        row, col = divmod(i, 4)
-        create_sticky(token, board_id, "", 80 + col * 220, 180 + row * 100, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-    # Three commitment cards (covered)
-    for i, (title, body) in enumerate([
-        ("Memory precedes complex thinking", "You cannot think critically about what you don't remember. Schema must be built before application."),
-        ("Retrieval strengthens memory", "Actively recalling information strengthens retention. Retrieval practice must be embedded."),
-        ("Cognitive load must be managed", "Working memory is limited. Simplify; remove elements that do not serve cognition."),
-    ]):
-        cx = 120 + i * 480
-        create_shape(token, board_id, cx, 420, 400, 180, frame_id, fill_color="#ffffff")
-        create_text(token, board_id, title, cx + 20, 440, frame_id, width=360, font_size=14)
-        create_text(token, board_id, body, cx + 20, 500, frame_id, width=360, font_size=11)
-        create_shape(token, board_id, cx, 418, 404, 184, frame_id, fill_color=FILL_DARK)
-        _rate_limit()
-    # Worked example
-    create_text(token, board_id, "Module outcome: Evaluate ethical frameworks", 80, 680, frame_id, width=400, font_size=12)
-    create_text(token, board_id, "Assessment: Multiple-choice quiz on definitions", 500, 680, frame_id, width=400, font_size=12)
-    create_text(token, board_id, "What is the misalignment?", 80, 740, frame_id, width=400, font_size=12)
-    for i in range(4):
-        create_sticky(token, board_id, "", 80 + i * 220, 780, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-    create_text(token, board_id, "Diagnosis: Outcome demands evaluation (higher-order); assessment only tests recognition. Commitment violated: Memory precedes complex thinking.", 80, 920, frame_id, width=900, font_size=11)
-    create_shape(token, board_id, 70, 900, 920, 60, frame_id, fill_color=FILL_DARK)
-    # Role columns
-    roles = [
-        ("Curriculum Design", COLOR_CURRICULUM, "Alignment? Reinforcement over time? Sequencing for transfer?"),
-        ("Learning / Experience Design", COLOR_LEARNING_DESIGN, "Cognitive operations? Retrieval? Visible reasoning?"),
-        ("Multimedia Design", COLOR_MULTIMEDIA, "Cognitive function of media? Load? Schema support?"),
-        ("Learning Technology", COLOR_LEARNING_TECH, "Affordances? Constraints? Analytics?"),
-    ]
-    for i, (name, color, prompts) in enumerate(roles):
-        cx = 80 + i * 380
-        create_text(token, board_id, name, cx, 1020, frame_id, width=340, font_size=12)
-        create_text(token, board_id, prompts, cx, 1060, frame_id, width=340, font_size=10)
-        for j in range(2):
-            create_sticky(token, board_id, "", cx + j * 180, 1160, frame_id, fill_color=color, width=160)
-            _rate_limit()
-
-
-def build_phase3(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 3 — Role Mapping", 80, 30, frame_id, width=600, font_size=18)
-    roles = [
-        ("Curriculum Design", COLOR_CURRICULUM, "How does this module align with programme capability? Where is knowledge reinforced? Sequencing for transfer?"),
-        ("Learning / Experience Design", COLOR_LEARNING_DESIGN, "What cognitive operations must learners practice? Where is retrieval? Visible reasoning?"),
-        ("Multimedia Design", COLOR_MULTIMEDIA, "What cognitive function does each media element serve? Load? Schema support?"),
-        ("Learning Technology", COLOR_LEARNING_TECH, "What affordances enable retrieval, feedback, collaboration? Where does platform constrain pedagogy? Analytics?"),
-    ]
-    for i, (name, color, prompts) in enumerate(roles):
-        cx = 80 + i * 380
-        create_text(token, board_id, name, cx, 80, frame_id, width=340, font_size=12)
-        create_text(token, board_id, prompts, cx, 120, frame_id, width=340, font_size=10)
-        for r in range(3):
-            create_sticky(token, board_id, "", cx + (r % 2) * 180, 220 + r * 100, frame_id, fill_color=color, width=160)
-            _rate_limit()
-    create_text(token, board_id, "Cross-role pairing: Their decision → Which commitment does it serve or violate?", 80, 580, frame_id, width=800, font_size=12)
-    create_text(token, board_id, "Decision", 80, 620, frame_id, width=200, font_size=10)
-    create_text(token, board_id, "Commitment", 300, 620, frame_id, width=200, font_size=10)
-    for i in range(6):
-        create_sticky(token, board_id, "", 80 + (i % 2) * 220, 660 + (i // 2) * 100, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
-
-
-def build_phase4(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 4 — Cross-Role Diagnosis", 80, 30, frame_id, width=600, font_size=18)
-    for t in range(NUM_TEAMS):
-        ty = 80 + t * 320
-        create_text(token, board_id, f"Team {t + 1}", 80, ty, frame_id, width=200, font_size=14)
-        create_text(token, board_id, "Your artefact: paste a screenshot or add a link below", 80, ty + 40, frame_id, width=500, font_size=10)
-        create_sticky(token, board_id, "", 80, ty + 80, frame_id, fill_color="light_yellow", width=400)
-        _rate_limit()
-        create_text(token, board_id, "Stage 1 — What must learners remember? Where is retrieval? Where is thinking visible? Where is load unnecessary?", 80, ty + 200, frame_id, width=900, font_size=10)
-        create_text(token, board_id, "Stage 2 — Where do role decisions contradict? Which contradiction most impairs learning? → This is your redesign focus for Phase 5.", 80, ty + 260, frame_id, width=900, font_size=10)
-        create_sticky(token, board_id, "", 80, ty + 290, frame_id, fill_color="light_yellow", width=400)
-        _rate_limit()
-    # Fallback artefact
-    create_text(token, board_id, "Sample artefact (use if your team has none): Programme: Apply risk frameworks. Module: 45-min video lecture. Assessment: Scenario reflection 2 weeks later. Media: Dense slides, no retrieval. Platform: LMS video + text.", 80, 80 + NUM_TEAMS * 320, frame_id, width=1000, font_size=10)
-
-
-def build_break_zone(token, board_id, frame_id):
-    create_shape(token, board_id, 0, 0, FRAME_WIDTH, 300, frame_id, fill_color=FILL_DARK)
-    create_text(token, board_id, "Break — 10 minutes", 80, 100, frame_id, width=400, font_size=24, color="#ffffff")
-    create_text(token, board_id, "When you return: identify the one misalignment most blocking learning. That is your redesign focus. One misalignment. Not all of them.", 80, 380, frame_id, width=800, font_size=12)
-
-
-def build_phase5_template(token, board_id, frame_id, team_label=""):
-    """Single Redesign Map template (duplicate in Miro once per team)."""
-    create_text(token, board_id, f"Phase 5 — Collaborative Redesign {team_label}".strip(), 80, 30, frame_id, width=700, font_size=18)
-    sections = [
-        ("1. Capability Object", "What must learners do 6–12 months later? What cognitive change is required?"),
-        ("2. Retrieval Points", "Where and when is knowledge retrieved after initial learning?"),
-        ("3. Visible Reasoning", "What prompts require learners to externalise thinking?"),
-        ("4. Load Reduction", "What extraneous elements were removed or simplified?"),
-        ("5. Media Justification", "What cognitive function does each medium serve?"),
-        ("6. Platform Alignment", "How does technology enable the design? What must the platform do that it currently cannot?"),
-        ("7. Connection to Programme", "How does this module contribute to programme-level capability?"),
-    ]
-    y = 80
-    for title, prompt in sections:
-        create_text(token, board_id, title, 80, y, frame_id, width=500, font_size=12)
-        create_text(token, board_id, prompt, 80, y + 28, frame_id, width=900, font_size=10)
-        create_sticky(token, board_id, "", 80, y + 50, frame_id, fill_color="light_yellow", width=400)
-        _rate_limit()
-        y += 140
-    create_text(token, board_id, "Learning Science Justification", 80, y, frame_id, width=400, font_size=12)
-    create_text(token, board_id, "Memory structures strengthened:\nRetrieval embedded at:\nCognitive load decisions:", 80, y + 30, frame_id, width=700, font_size=10)
-    create_sticky(token, board_id, "", 80, y + 90, frame_id, fill_color="light_yellow", width=500)
-    _rate_limit()
-
-
-def build_phase5(token, board_id, frame_id):
-    # One template; facilitator duplicates per team (see playbook)
-    build_phase5_template(token, board_id, frame_id, team_label="(Template — duplicate per team)")
-
-
-def build_phase6(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 6 — Cross-Team Critique (Gallery Walk)", 80, 30, frame_id, width=700, font_size=18)
-    create_text(token, board_id, "Review at least two other teams' Redesign Maps. For each map add:", 80, 80, frame_id, width=800, font_size=12)
-    create_text(token, board_id, "Green — Strength: What aligns with learning science? Name the commitment.", 80, 120, frame_id, width=400, font_size=10)
-    create_text(token, board_id, "Yellow — Tension: Where might the design impair learning? Name the commitment.", 500, 120, frame_id, width=400, font_size=10)
-    create_text(token, board_id, "Blue — Clarification question: What needs more explanation?", 80, 160, frame_id, width=400, font_size=10)
-    for i in range(12):
-        row, col = divmod(i, 3)
-        color = ["light_green", "light_yellow", "light_blue"][col]
-        create_sticky(token, board_id, "", 80 + col * 220, 200 + row * 110, frame_id, fill_color=color, width=200)
-        _rate_limit()
-
-
-def build_phase7(token, board_id, frame_id):
-    create_text(token, board_id, "Phase 7 — Collaboration Charter & Closing", 80, 30, frame_id, width=700, font_size=18)
-    prompts = [
-        "One decision I will no longer make alone",
-        "One role I need earlier in the design process",
-        "One learning science principle I will use in future discussions",
-        "One process change we will implement in the next design cycle",
-    ]
-    for i, p in enumerate(prompts):
-        create_text(token, board_id, p, 80, 80 + i * 100, frame_id, width=600, font_size=12)
-        for j in range(4):
-            create_sticky(token, board_id, "", 80 + j * 220, 120 + i * 100, frame_id, fill_color=[COLOR_CURRICULUM, COLOR_LEARNING_DESIGN, COLOR_MULTIMEDIA, COLOR_LEARNING_TECH][j % 4], width=200)
-            _rate_limit()
-    create_text(token, board_id, "30-day follow-up: One decision you made differently; one place collaboration improved; one remaining misalignment. Note date and calendar link below.", 80, 520, frame_id, width=800, font_size=10)
-    create_text(token, board_id, "No notes. Write three things: (1) How you now define learning. (2) One way your role mediates cognitive change. (3) One collaboration commitment you are taking forward.", 80, 620, frame_id, width=800, font_size=12)
-    create_shape(token, board_id, 0, 600, FRAME_WIDTH, 320, frame_id, fill_color=FILL_DARK)
-    create_text(token, board_id, "No notes. Write three things.", 80, 680, frame_id, width=600, font_size=18, color="#ffffff")
-    create_text(token, board_id, "1. How you now define learning\n2. One way your role mediates cognitive change\n3. One collaboration commitment you are taking forward", 80, 740, frame_id, width=700, font_size=12, color="#e0e0e0")
-    for i in range(min(8, NUM_PARTICIPANT_SLOTS)):
-        row, col = divmod(i, 4)
-        create_sticky(token, board_id, "", 80 + col * 220, 860 + row * 100, frame_id, fill_color="light_yellow", width=200)
-        _rate_limit()
+class Journal:
+    """Append-only local record of built items: one JSON line per key, Miro ID and content hash.
+
+    Keys are "board", the zone key of each frame, and the item keys from the compiled plan.
+    A line with a null ID records a deletion. Later lines win, so replaying the journal
+    gives the board as last built: --resume skips items already listed, and sync compares
+    the hashes with the current spec.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.ids = {}
+        self.hashes = {}
+        self.lock = threading.Lock()
+        if resume:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # last line cut short by the failure
+                    self._set(entry["key"], entry["id"], entry.get("hash"))
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _set(self, key, item_id, digest):
+        if item_id is None:
+            self.ids.pop(key, None)
+            self.hashes.pop(key, None)
+        else:
+            self.ids[key] = item_id
+            self.hashes[key] = digest
+
+    def get(self, key):
+        return self.ids.get(key)
+
+    def hash(self, key):
+        return self.hashes.get(key)
+
+    def keys(self):
+        return list(self.ids)
+
+    def record(self, key, item_id, digest=None):
+        with self.lock:
+            self._set(key, item_id, digest)
+            self.file.write(json.dumps({"key": key, "id": item_id, "hash": digest}) + "\n")
+            self.file.flush()
+        return item_id
+
+    def close(self):
+        self.file.close()
+
+
+def _pending(journal, item, live):
+    """What `item` needs: ("create", None), ("update", id) or (None, id) when it is up to date.
+
+    Without `live` (a build or --resume) anything in the journal counts as done. With the
+    set of IDs currently on the board (sync), journaled items that have been removed by
+    hand are recreated and items whose content hash changed are updated in place.
+    """
+    item_id = journal.get(item["key"])
+    if item_id is None or (live is not None and item_id not in live):
+        return "create", None
+    if live is not None and journal.hash(item["key"]) != item_hash(item):
+        return "update", item_id
+    return None, item_id
+
+
+def _put(client, journal, board_id, item, parent_id=None, item_id=None):
+    if item_id:
+        client.update_item(board_id, item_id, item, parent_id)
+    else:
+        item_id = client.create_item(board_id, item, parent_id)
+    return journal.record(item["key"], item_id, item_hash(item))
+
+
+def _put_many(client, journal, board_id, items, parent_id):
+    for item, item_id in zip(items, client.create_items(board_id, items, parent_id)):
+        journal.record(item["key"], item_id, item_hash(item))
+
+
+def _fill_zone(pool, client, journal, board_id, frame_id, items, live):
+    """Bring one frame's items up to date, layer by layer. Returns a Counter of actions.
+
+    Bulk items still to be created go out BULK_LIMIT per call; everything else is one
+    call per item.
+    """
+    counts = Counter()
+    layers = {}
+    for item in items:
+        layers.setdefault(item["layer"], []).append(item)
+    for layer in sorted(layers):
+        futures, batch = [], []
+        for item in layers[layer]:
+            action, item_id = _pending(journal, item, live)
+            counts[action or "unchanged"] += 1
+            if action == "create" and item["bulk"]:
+                batch.append(item)
+            elif action:
+                futures.append(pool.submit(_put, client, journal, board_id, item, frame_id, item_id))
+        for i in range(0, len(batch), BULK_LIMIT):
+            futures.append(pool.submit(_put_many, client, journal, board_id, batch[i:i + BULK_LIMIT], frame_id))
+        for f in futures:
+            f.result()
+    return counts
+
+
+def _summary(counts):
+    words = {"create": "created", "update": "updated", "clear": "cleared", "delete": "deleted", "unchanged": "unchanged"}
+    return ", ".join(f"{counts[k]} {w}" for k, w in words.items() if counts[k]) or "nothing to do"
+
+
+def build_board(client, journal, board_id, plan, workers=MAX_WORKERS, live=None, label=None):
+    """Create or update every frame first, then fill all frames with at most `workers` requests in flight.
+
+    Frames and items already in `journal` are reused, so the same call resumes an
+    interrupted build. Pass `live` (the set of item IDs on the board) to sync instead:
+    see _pending. `label` prefixes progress lines when several boards build at once.
+    Returns a Counter of actions taken.
+    """
+    counts = Counter()
+    by_zone = {zone["key"]: [] for zone in plan["zones"]}
+    for item in plan["items"]:
+        by_zone[item["zone"]].append(item)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, ThreadPoolExecutor(max_workers=len(plan["zones"])) as zone_pool:
+        frame_futures = {}
+        for zone in plan["zones"]:
+            action, frame_id = _pending(journal, zone, live)
+            counts[action or "unchanged"] += 1
+            if action:
+                frame_futures[zone["key"]] = pool.submit(_put, client, journal, board_id, zone, None, frame_id)
+        frame_ids = {key: f.result() for key, f in frame_futures.items()}
+
+        fills = {}
+        for zone in plan["zones"]:
+            frame_id = frame_ids.get(zone["key"]) or journal.get(zone["key"])
+            fills[zone_pool.submit(_fill_zone, pool, client, journal, board_id, frame_id, by_zone[zone["key"]], live)] = zone
+        for f in as_completed(fills):
+            zone_counts = f.result()
+            counts.update(zone_counts)
+            if zone_counts["create"] or zone_counts["update"]:
+                prefix = f"[{label}] " if label else ""
+                print(f"  {prefix}{fills[f]['title']}: {_summary(zone_counts)}")
+    return counts
+
+
+def remove_stale(client, journal, board_id, plan, live, workers=MAX_WORKERS):
+    """Delete journaled items whose keys are no longer in the plan. Returns the number deleted.
+
+    Items go before frames, so nothing is left pointing at a frame that has gone.
+    """
+    wanted = {zone["key"] for zone in plan["zones"]} | {item["key"] for item in plan["items"]}
+    stale = [key for key in journal.keys() if key != "board" and key not in wanted]
+
+    def drop(key):
+        item_id = journal.get(key)
+        if item_id in live:
+            client.delete_item(board_id, item_id, zone=key.split("/")[0])
+        journal.record(key, None)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(drop, [key for key in stale if "/" in key]))
+        list(pool.map(drop, [key for key in stale if "/" not in key]))
+    return len(stale)
+
+
+def sync_board(client, path, plan, workers=MAX_WORKERS):
+    """Diff the board recorded in the journal at `path` against `plan` and apply the changes.
+
+    Costs one listing call per 50 items on the board plus one call per changed item.
+    Returns (board_id, Counter of actions).
+    """
+    journal = Journal(path, resume=True)
+    try:
+        board_id = journal.get("board")
+        live = {item["id"] for item in client.list_items(board_id)}
+        deleted = remove_stale(client, journal, board_id, plan, live, workers)
+        counts = build_board(client, journal, board_id, plan, workers, live=live)
+        counts["delete"] += deleted
+    finally:
+        journal.close()
+    return board_id, counts
+
+
+# -----------------------------------------------------------------------------
+# Reset
+# -----------------------------------------------------------------------------
+def _is_cover(item):
+    return item["type"] == "shape" and item.get("overlay") and item["fill_color"] == FILL_DARK
+
+
+def _moved(live_item, item, parent_id):
+    """True when a live item is no longer where the plan puts it (e.g. a cover dragged aside)."""
+    want = item_body(item, parent_id)["position"]
+    have = live_item.get("position") or {}
+    return any(abs(float(have.get(axis, want[axis])) - want[axis]) > 1 for axis in ("x", "y"))
+
+
+def reset_board(client, path, plan, workers=MAX_WORKERS):
+    """Return the board in the journal at `path` to its as-built state for the next cohort.
+
+    Sticky notes added inside the frames are deleted, the spec's own sticky notes are
+    cleared back to their spec content and position, and dark cover shapes are put back
+    over what they hide. Prompts and anything outside the frames are left alone.
+    Miro has no way to raise an item, so a missing cover is recreated together with
+    the items drawn on top of it. Costs one listing call per 50 items on the board plus
+    one call per changed item. Returns (board_id, Counter of actions).
+    """
+    journal = Journal(path, resume=True)
+    try:
+        board_id = journal.get("board")
+        live = {item["id"]: item for item in client.list_items(board_id)}
+        frame_ids = {zone["key"]: journal.get(zone["key"]) for zone in plan["zones"]}
+        planned = {journal.get(item["key"]): item for item in plan["items"] if journal.get(item["key"])}
+
+        # Covers that have gone, and everything stacked above them, are created again
+        restack = {}
+        for cover in plan["items"]:
+            if _is_cover(cover) and journal.get(cover["key"]) not in live:
+                restack[cover["key"]] = cover
+                for item in plan["items"]:
+                    if item["zone"] == cover["zone"] and item["layer"] > cover["layer"] and layout.intersects(item, cover):
+                        restack[item["key"]] = item
+
+        drop, fix = [], []
+        for item_id, live_item in live.items():
+            parent_id = (live_item.get("parent") or {}).get("id")
+            item = planned.get(item_id)
+            if item and item["key"] in restack:
+                drop.append(item_id)
+            elif live_item["type"] == "sticky_note" and parent_id in frame_ids.values():
+                if item is None:
+                    drop.append(item_id)
+                elif (plain_text(live_item.get("data", {}).get("content")) != plain_text(item["content"])
+                      or _moved(live_item, item, parent_id)):
+                    fix.append(item)
+            elif item and _is_cover(item) and _moved(live_item, item, parent_id):
+                fix.append(item)
+
+        zones = {frame_id: zone for zone, frame_id in frame_ids.items()}
+
+        def delete(item_id):
+            client.delete_item(board_id, item_id, zone=zones.get((live[item_id].get("parent") or {}).get("id")))
+            if item_id in planned:
+                journal.record(planned[item_id]["key"], None)
+
+        counts = Counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(delete, item_id) for item_id in drop]
+            futures += [pool.submit(_put, client, journal, board_id, item, frame_ids[item["zone"]], journal.get(item["key"]))
+                        for item in fix]
+            for f in futures:
+                f.result()
+            counts["delete"] = sum(item_id not in planned for item_id in drop)
+            counts["clear"] = len(fix)
+
+            remaining = set(live) - set(drop)
+            missing = {zone: [] for zone in frame_ids}
+            for item in plan["items"]:
+                if item["key"] in restack or (item["type"] == "sticky_note" and journal.get(item["key"]) not in remaining):
+                    missing[item["zone"]].append(item)
+            for zone, items in missing.items():
+                if items:
+                    counts["create"] += _fill_zone(pool, client, journal, board_id, frame_ids[zone], items, remaining)["create"]
+    finally:
+        journal.close()
+    return board_id, counts
+
+
+# -----------------------------------------------------------------------------
+# Export
+# -----------------------------------------------------------------------------
+def _board_ref(ref):
+    """A board ID, or a journal path. Returns (board_id, {frame_id: zone key} from the journal)."""
+    if not ref.endswith(".jsonl"):
+        return ref, {}
+    journal = Journal(ref, resume=True)
+    journal.close()
+    frames = {journal.get(key): key for key in journal.keys() if key != "board" and "/" not in key}
+    return journal.get("board"), frames
+
+
+def _pump(pages, q, stop):
+    """Feed pages into a bounded queue, then None. Gives up once `stop` is set."""
+    for page in itertools.chain(pages, [None]):
+        while not stop.is_set():
+            try:
+                q.put(page, timeout=0.5)
+                break
+            except queue.Full:
+                pass
+
+
+def export_board(client, board_id, out, phases, workers=MAX_WORKERS, loose=False):
+    """Stream every item on the board to `out` as JSON lines, grouped by parent frame.
+
+    Frames are written left to right, each followed by its items. While one frame is
+    written, the next frames' pages are already being fetched (up to `workers` frames,
+    PREFETCH_PAGES pages each), so memory stays flat however large the board.
+    `phases(frame)` returns the zone key for a frame item. With `loose`, items outside
+    any frame follow at the end (this costs one pass over the whole board).
+    Returns the number of items written.
+    """
+    frames = sorted(client.list_items(board_id, item_type="frame"), key=lambda f: f.get("position", {}).get("x", 0))
+    written = 0
+
+    def write(item, frame):
+        title = frame.get("data", {}).get("title") if frame else None
+        out.write(json.dumps(dict(item, board_id=board_id, phase=phases(frame) if frame else None, frame_title=title)) + "\n")
+
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        queues = [queue.Queue(maxsize=PREFETCH_PAGES) for _ in frames]
+        futures = [pool.submit(_pump, client.list_pages(board_id, parent_id=f["id"]), q, stop) for f, q in zip(frames, queues)]
+        try:
+            for frame, q, future in zip(frames, queues, futures):
+                write(frame, frame)
+                written += 1
+                while True:
+                    try:
+                        page = q.get(timeout=0.5)
+                    except queue.Empty:
+                        if future.done():
+                            future.result()  # the fetch failed before queueing its end marker
+                        continue
+                    if page is None:
+                        break
+                    for item in page:
+                        write(item, frame)
+                    written += len(page)
+        finally:
+            stop.set()
+    if loose:
+        for item in client.list_items(board_id):
+            if item["type"] != "frame" and not item.get("parent"):
+                write(item, None)
+                written += 1
+    return written
+
+
+def run_export(args, plan):
+    titles = {zone["title"]: zone["key"] for zone in plan["zones"]}
+    os.makedirs(args.out, exist_ok=True)
+
+    boards = {}
+    for ref in args.boards:
+        board_id, frame_zones = _board_ref(ref)
+        boards.setdefault(board_id, {}).update(frame_zones)
+
+    def export_one(board_id):
+        frame_zones = boards[board_id]
+
+        def phases(frame):
+            return frame_zones.get(frame["id"]) or titles.get(frame.get("data", {}).get("title"))
+
+        path = os.path.join(args.out, f"{board_id}.jsonl")
+        started = time.monotonic()
+        with open(path + ".part", "w", encoding="utf-8") as out:
+            count = export_board(client, board_id, out, phases, loose=args.loose)
+        os.replace(path + ".part", path)
+        print(f"  {board_id}: {count} items -> {path} ({time.monotonic() - started:.1f}s)")
+        return count
+
+    started = time.monotonic()
+    with open_client(pool_size=BOARDS_IN_FLIGHT * MAX_WORKERS) as client:
+        with ThreadPoolExecutor(max_workers=BOARDS_IN_FLIGHT) as pool:
+            total = sum(pool.map(export_one, boards))
+    print(f"Exported {total} items from {len(boards)} boards in {time.monotonic() - started:.1f}s")
+    return 0
+
+
+# -----------------------------------------------------------------------------
+# Harvest
+# -----------------------------------------------------------------------------
+def harvest_board(client, board_id, zones, state, frame_zones=None):
+    """Return dataset rows for sticky notes that are new or edited since the last harvest.
+
+    `zones` maps each harvested zone key to its spec entry; `state` is this board's entry
+    in the harvest state, updated in place. Each harvested frame's stickies are listed (one
+    request per 50 notes) and compared with the modifiedAt recorded for each note last
+    time. The board's own modifiedAt is not used to skip the listing: Miro does not
+    document that it changes when an item on the board is edited. Empty notes are not
+    written but are remembered, so they show up once someone writes on them.
+    """
+    if not state.get("frames"):
+        titles = {zone["title"]: key for key, zone in zones.items()}
+        frames = {}
+        for frame in client.list_items(board_id, item_type="frame"):
+            key = (frame_zones or {}).get(frame["id"]) or titles.get(frame.get("data", {}).get("title"))
+            if key in zones:
+                frames[frame["id"]] = key
+        state["frames"] = frames
+
+    roles = {color: role for role, color in ROLE_COLORS.items()}
+    seen = state.setdefault("items", {})
+    harvested_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    rows = []
+    for frame_id, key in state["frames"].items():
+        legend = zones[key]["harvest"] if isinstance(zones[key]["harvest"], dict) else {}
+        for item in client.list_items(board_id, item_type="sticky_note", parent_id=frame_id):
+            modified = item.get("modifiedAt")
+            if seen.get(item["id"]) == modified:
+                continue
+            seen[item["id"]] = modified
+            text = plain_text(item.get("data", {}).get("content"))
+            if not text:
+                continue
+            color = item.get("style", {}).get("fillColor")
+            rows.append({
+                "board_id": board_id, "phase": key, "frame_title": zones[key]["title"], "item_id": item["id"],
+                "text": text, "fill_color": color,
+                "role": None if legend else roles.get(color), "category": legend.get(color),
+                "created_at": item.get("createdAt"), "modified_at": modified, "harvested_at": harvested_at,
+            })
+    return rows
+
+
+def _save_json(path, data):
+    with open(path + ".part", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(path + ".part", path)
+
+
+def run_harvest(args, plan):
+    zones = {zone["key"]: zone for zone in load_spec(args.spec)["zones"] if zone.get("harvest")}
+    boards = {}
+    for ref in args.boards:
+        board_id, frame_zones = _board_ref(ref)
+        boards.setdefault(board_id, {}).update(frame_zones)
+    state = {}
+    if os.path.exists(args.state):
+        with open(args.state, encoding="utf-8") as f:
+            state = json.load(f)
+    lock = threading.Lock()
+
+    def harvest_one(out, board_id):
+        board_state = json.loads(json.dumps(state.get(board_id, {})))  # committed only once rows are written
+        rows = harvest_board(client, board_id, zones, board_state, boards[board_id])
+        with lock:
+            for row in rows:
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+            out.flush()
+            state[board_id] = board_state
+            _save_json(args.state, state)
+        return len(rows)
+
+    with open_client(pool_size=BOARDS_IN_FLIGHT) as client:
+        while True:
+            started = time.monotonic()
+            calls = client.calls
+            with open(args.out, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=BOARDS_IN_FLIGHT) as pool:
+                counts = list(pool.map(lambda board_id: harvest_one(out, board_id), boards))
+            print(f"Harvested {sum(counts)} new or edited notes from {len(boards)} boards "
+                  f"({client.calls - calls} requests, {time.monotonic() - started:.1f}s) -> {args.out}")
+            if not args.every:
+                return 0
+            try:
+                time.sleep(args.every)
+            except KeyboardInterrupt:
+                return 0
 
 
 # -----------------------------------------------------------------------------
 # Main
 # -----------------------------------------------------------------------------
-def main():
-    token = get_token()
-    print("Creating board...")
-    board_id = create_board(token)
-    _rate_limit()
-    # Frame centers left to right; origin board center (0,0)
-    step = FRAME_WIDTH + FRAME_GAP
-    start_x = -4 * step  # 9 frames: -4,-3,-2,-1,0,1,2,3,4
-    zones = [
-        ("Landing Zone", build_landing),
-        ("Phase 1 — Framing the Shared Object", build_phase1),
-        ("Phase 2 — Learning Science Core", build_phase2),
-        ("Phase 3 — Role Mapping", build_phase3),
-        ("Phase 4 — Cross-Role Diagnosis", build_phase4),
-        ("Break", build_break_zone),
-        ("Phase 5 — Collaborative Redesign", build_phase5),
-        ("Phase 6 — Cross-Team Critique", build_phase6),
-        ("Phase 7 — Collaboration Charter", build_phase7),
-    ]
-    frame_ids = []
-    for i, (title, builder) in enumerate(zones):
-        x = start_x + i * step
-        fill = FILL_LIGHT_ZONE
-        if "Break" in title:
-            fill = FILL_DARK
-        fid = create_frame(token, board_id, title, x, 0, fill_color=fill)
-        frame_ids.append((title, fid))
-        _rate_limit()
-        builder(token, board_id, fid)
-        print(f"  Built: {title}")
+def run_build(args, plan):
+    if args.resume and not os.path.exists(args.journal):
+        print(f"No journal at {args.journal}; run without --resume first.", file=sys.stderr)
+        return 1
+
+    journal = Journal(args.journal, resume=args.resume)
+    with open_client(trace=args.trace) as client:
+        board_id = journal.get("board")
+        resumed = bool(board_id)
+        if resumed:
+            print(f"Resuming board {board_id} from {args.journal}...")
+        else:
+            print("Creating board...")
+            board = plan["board"]
+            board_id = journal.record("board", client.create_board(board["name"], board["description"], os.environ.get("MIRO_TEAM_ID", "").strip() or None))
+        started = time.monotonic()
+        try:
+            counts = build_board(client, journal, board_id, plan)
+        except Exception:
+            print(f"\nBuild interrupted. Rerun with `build --resume` to finish board {board_id}.", file=sys.stderr)
+            raise
+        finally:
+            journal.close()
+        print(f"  Filled {len(plan['zones'])} frames in {time.monotonic() - started:.1f}s")
 
     # Board view URL (open in browser)
     view_url = f"https://miro.com/app/board/{board_id}/"
     print("")
-    print("Board created successfully.")
+    changed = counts["create"] or counts["update"]
+    if not resumed:
+        print("Board created successfully.")
+    elif changed:
+        print(f"Board resumed: {_summary(counts)}.")
+    else:
+        print(f"Board already complete: {_summary(counts)}.")
     print("Open:", view_url)
+    if resumed and not changed:
+        return 0
     print("")
     print("Next steps (see miro-playbook.md):")
-    print("  1. Duplicate the Phase 5 Redesign Map template once per team and label each copy.")
-    print("  2. Add participant names to Landing zone sticky notes (or leave placeholders).")
-    print("  3. Add Timer widget in Phase 2 (Insert > Apps > Timer).")
-    print("  4. Lock zone headers, prompts, and cover shapes; unlock cover shapes when revealing.")
+    print("  1. Add participant names to Landing zone sticky notes (or leave placeholders).")
+    print("  2. Add Timer widget in Phase 2 (Insert > Apps > Timer).")
+    print("  3. Lock zone headers, prompts, and cover shapes; unlock cover shapes when revealing.")
+    return 0
+
+
+def run_sync(args, plan):
+    missing = [path for path in args.journals if not os.path.exists(path)]
+    if missing:
+        print(f"No journal at {missing[0]}; build the board first.", file=sys.stderr)
+        return 1
+
+    with open_client(trace=args.trace) as client:
+        for path in args.journals:
+            print(f"Syncing {path}...")
+            board_id, counts = sync_board(client, path, plan)
+            print(f"  Board {board_id}: {_summary(counts)}")
+    return 0
+
+
+def run_reset(args, plan):
+    missing = [path for path in args.journals if not os.path.exists(path)]
+    if missing:
+        print(f"No journal at {missing[0]}; build the board first.", file=sys.stderr)
+        return 1
+
+    with open_client(trace=args.trace) as client:
+        for path in args.journals:
+            print(f"Resetting {path}...")
+            started, calls = time.monotonic(), client.calls
+            board_id, counts = reset_board(client, path, plan)
+            print(f"  Board {board_id}: {_summary(counts)} ({client.calls - calls} requests, {time.monotonic() - started:.1f}s)")
+    return 0
+
+
+def read_roster(path):
+    """Cohorts from a roster CSV: a "cohort" column, plus optional "board_name" and "team_id"."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [{k.strip(): (v or "").strip() for k, v in row.items() if k} for row in csv.DictReader(f)]
+    rows = [row for row in rows if row.get("cohort")]
+    slugs = [re.sub(r"[^a-z0-9]+", "-", row["cohort"].lower()).strip("-") for row in rows]
+    dupes = sorted({s for s in slugs if slugs.count(s) > 1})
+    if dupes:
+        raise ValueError(f"{path}: cohort names must be unique (repeated: {', '.join(dupes)})")
+    for row, slug in zip(rows, slugs):
+        row["slug"] = slug
+    return rows
+
+
+def _build_cohort(client, plan, cohort, journal_dir, resume):
+    """Build (or finish) one cohort's board. Returns (board_id, Counter, seconds)."""
+    started = time.monotonic()
+    path = os.path.join(journal_dir, f"{cohort['slug']}.jsonl")
+    journal = Journal(path, resume=resume and os.path.exists(path))
+    try:
+        board_id = journal.get("board")
+        if not board_id:
+            board = plan["board"]
+            name = cohort.get("board_name") or f"{cohort['cohort']} — {board['name']}"
+            team_id = cohort.get("team_id") or os.environ.get("MIRO_TEAM_ID", "").strip() or None
+            board_id = journal.record("board", client.create_board(name, board["description"], team_id))
+        counts = build_board(client, journal, board_id, plan, label=cohort["cohort"])
+    finally:
+        journal.close()
+    return board_id, counts, time.monotonic() - started
+
+
+def run_build_many(args, plan):
+    cohorts = read_roster(args.roster)
+    if not cohorts:
+        print(f"No cohorts in {args.roster}; it needs a \"cohort\" column.", file=sys.stderr)
+        return 1
+    os.makedirs(args.journal_dir, exist_ok=True)
+
+    started = time.monotonic()
+    results, failed = {}, {}
+    with open_client(pool_size=args.parallel * MAX_WORKERS, trace=args.trace) as client:
+        print(f"Building {len(cohorts)} boards, {args.parallel} at a time...")
+        with ThreadPoolExecutor(max_workers=args.parallel) as boards:
+            futures = {boards.submit(_build_cohort, client, plan, c, args.journal_dir, args.resume): c for c in cohorts}
+            for f in as_completed(futures):
+                cohort = futures[f]["cohort"]
+                try:
+                    results[cohort] = f.result()
+                except Exception as e:
+                    failed[cohort] = e
+                    print(f"[{cohort}] failed: {e}", file=sys.stderr)
+                    continue
+                board_id, counts, seconds = results[cohort]
+                print(f"[{cohort}] done in {seconds:.1f}s ({_summary(counts)}) — {len(results) + len(failed)}/{len(cohorts)} boards")
+        waited = client.limiter.waited
+
+    elapsed = time.monotonic() - started
+    total = Counter()
+    for _, counts, _ in results.values():
+        total.update(counts)
+    print("")
+    print(f"Built {len(results)} of {len(cohorts)} boards in {elapsed:.1f}s: {_summary(total)}, "
+          f"{total['create'] / max(elapsed, 1e-9):.0f} items/s, {waited:.0f}s of request time queued on the rate limit")
+    for c in cohorts:
+        if c["cohort"] in results:
+            print(f"  {c['cohort']}: https://miro.com/app/board/{results[c['cohort']][0]}/")
+    if failed:
+        print(f"\n{len(failed)} boards did not finish. Rerun with `build-many --resume {args.roster}` to finish them.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_bench(args, plan):
+    from standin import StandIn  # only needed here; keeps the other commands to miro.py alone
+
+    spec = load_spec(args.spec)
+    sizes = [tuple(int(n) for n in size.split("x")) for size in args.sizes.split(",")]
+    print(f"Stand-in: {args.latency * 1000:.0f} ms latency, {args.credits} credits/min, "
+          f"{args.throttle_rate:.0%} throttled, {args.error_rate:.0%} failing; {args.workers} workers")
+    print(f"{'participants x teams':>20} {'items':>6} {'calls':>6} {'retries':>7} {'seconds':>8} {'items/s':>8}")
+    for participants, teams in sizes:
+        sized = compile_plan(spec, participants=participants, teams=teams)
+        with StandIn(latency=args.latency, credits=args.credits, throttle_rate=args.throttle_rate,
+                     error_rate=args.error_rate, seed=args.seed) as server:
+            with MiroClient("stand-in", base=server.url, pool_size=args.workers, limiter=RateLimiter(args.credits)) as client:
+                journal = Journal(os.devnull)
+                started = time.monotonic()
+                board_id = journal.record("board", client.create_board(sized["board"]["name"]))
+                with contextlib.redirect_stdout(io.StringIO()):  # per-zone progress would swamp the table
+                    counts = build_board(client, journal, board_id, sized, workers=args.workers)
+                elapsed = time.monotonic() - started
+                journal.close()
+        items = counts["create"]
+        print(f"{f'{participants} x {teams}':>20} {items:>6} {client.calls:>6} {client.retries:>7} {elapsed:>8.2f} {items / elapsed:>8.1f}")
     return 0
 
 
+def run_preview(args, plan):
+    from preview import PreviewBoard  # only needed here
+
+    started = time.monotonic()
+    plan = compile_plan(load_spec(args.spec), participants=args.participants, teams=args.teams)
+    board = PreviewBoard()
+    journal = Journal(os.devnull)
+    board_id = journal.record("board", board.create_board(plan["board"]["name"]))
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_board(board, journal, board_id, plan, workers=1)
+    journal.close()
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(board.svg() if args.out.endswith(".svg") else board.html())
+    print(f"Previewed {len(board.items)} items in {time.monotonic() - started:.2f}s -> {args.out}")
+    return 0
+
+
+def finish_trace(args):
+    """Print the latency tables and write the run report (and spans, if asked for)."""
+    report = args.trace.report(spec=os.path.basename(args.spec))
+    args.trace.print_histograms(report)
+    if args.report:
+        args.trace.write_report(args.report, report)
+        print(f"Run report: {args.report}")
+    if args.spans:
+        count = args.trace.write_spans(args.spans)
+        print(f"Appended {count} spans to {args.spans}")
+
+
+COMMANDS = {
+    "build": run_build,
+    "sync": run_sync,
+    "reset": run_reset,
+    "build-many": run_build_many,
+    "bench": run_bench,
+    "preview": run_preview,
+    "export": run_export,
+    "harvest": run_harvest,
+}
+
+
+def main(argv=None):
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--spec", default=SPEC_PATH, help=f"board spec path (default: {os.path.basename(SPEC_PATH)})")
+    traced = argparse.ArgumentParser(add_help=False)
+    traced.add_argument("--report", default=REPORT_PATH, metavar="PATH",
+                        help=f"write a JSON run report here, '' for none (default: {os.path.basename(REPORT_PATH)})")
+    traced.add_argument("--spans", metavar="PATH", help="also append the run's API calls as OpenTelemetry spans (OTLP/JSON)")
+    parser = argparse.ArgumentParser(description="Build the workshop Miro board and keep built boards in step with the spec.")
+    sub = parser.add_subparsers(dest="command")
+    p = sub.add_parser("build", parents=[common, traced], help="create a new board (the default command)")
+    p.add_argument("--resume", action="store_true", help="reuse the board in the journal and create only missing items")
+    p.add_argument("--journal", default=JOURNAL_PATH, help=f"item journal path (default: {os.path.basename(JOURNAL_PATH)})")
+    p = sub.add_parser("sync", parents=[common, traced], help="update built boards to match the spec")
+    p.add_argument("journals", nargs="*", default=[JOURNAL_PATH], metavar="JOURNAL", help="journal of each board to sync (default: the local journal)")
+    p = sub.add_parser("reset", parents=[common, traced], help="clear participants' sticky notes and restore covers for the next cohort")
+    p.add_argument("journals", nargs="*", default=[JOURNAL_PATH], metavar="JOURNAL", help="journal of each board to reset (default: the local journal)")
+    p = sub.add_parser("build-many", parents=[common, traced], help="build one board per cohort in a roster CSV")
+    p.add_argument("roster", help='CSV with a "cohort" column and optional "board_name" and "team_id" columns')
+    p.add_argument("--parallel", type=int, default=BOARDS_IN_FLIGHT, help=f"boards built at once (default: {BOARDS_IN_FLIGHT})")
+    p.add_argument("--journal-dir", default=JOURNAL_DIR, help=f"one journal per cohort goes here (default: {os.path.basename(JOURNAL_DIR)}/)")
+    p.add_argument("--resume", action="store_true", help="reuse boards that already have a journal and create only missing items")
+    p = sub.add_parser("export", parents=[common], help="stream every item on boards to JSONL, grouped by frame")
+    p.add_argument("boards", nargs="+", metavar="BOARD", help="board ID, or the board's journal (.jsonl)")
+    p.add_argument("--out", default=EXPORT_DIR, help=f"output folder (default: {os.path.basename(EXPORT_DIR)}/)")
+    p.add_argument("--loose", action="store_true", help="also export items outside any frame (one extra pass over the board)")
+    p = sub.add_parser("harvest", parents=[common], help="append new or edited sticky notes from harvested zones to a dataset")
+    p.add_argument("boards", nargs="+", metavar="BOARD", help="board ID, or the board's journal (.jsonl)")
+    p.add_argument("--out", default=HARVEST_PATH, help=f"dataset to append to (default: {os.path.basename(HARVEST_PATH)})")
+    p.add_argument("--state", default=HARVEST_STATE_PATH, help=f"what earlier harvests saw (default: {os.path.basename(HARVEST_STATE_PATH)})")
+    p.add_argument("--every", type=float, default=0, metavar="SECONDS", help="keep polling at this interval until Ctrl+C")
+    p = sub.add_parser("preview", parents=[common], help="render the board offline to HTML or SVG (no token needed)")
+    p.add_argument("--out", default=PREVIEW_PATH, help=f"output file, .html or .svg (default: {os.path.basename(PREVIEW_PATH)})")
+    p.add_argument("--participants", type=int, default=NUM_PARTICIPANT_SLOTS, help=f"participant slots (default: {NUM_PARTICIPANT_SLOTS})")
+    p.add_argument("--teams", type=int, default=NUM_TEAMS, help=f"teams (default: {NUM_TEAMS})")
+    p = sub.add_parser("bench", parents=[common], help="time builds against the local stand-in server (no token needed)")
+    p.add_argument("--sizes", default="16x4,32x8,64x16", help="comma-separated participants x teams (default: 16x4,32x8,64x16)")
+    p.add_argument("--workers", type=int, default=MAX_WORKERS, help=f"requests in flight (default: MAX_WORKERS, {MAX_WORKERS})")
+    p.add_argument("--latency", type=float, default=0.05, help="seconds per stand-in response (default: 0.05)")
+    p.add_argument("--credits", type=int, default=RATE_LIMIT_CREDITS, help=f"rate-limit credits per minute (default: {RATE_LIMIT_CREDITS})")
+    p.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of calls answered 429")
+    p.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered 500")
+    p.add_argument("--seed", type=int, default=1, help="seed for injected faults")
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS and argv[0] not in ("-h", "--help"):
+        argv.insert(0, "build")
+    args = parser.parse_args(argv)
+    plan = compile_plan(load_spec(args.spec))
+    args.trace = Trace(args.command) if hasattr(args, "report") else None
+    try:
+        return COMMANDS[args.command](args, plan)
+    finally:
+        if args.trace and args.trace.calls:
+            finish_trace(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
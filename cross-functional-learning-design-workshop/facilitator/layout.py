@@ -0,0 +1,164 @@
+"""
+Layout helpers for the board plan: item sizes, a spatial index and flow placement.
+
+compile_plan in build-miro-board.py positions items from board-spec.json with these.
+Spec coordinates are where an element would like to go; an element that would overlap
+one placed before it is moved down just far enough to clear it, and frames grow to fit
+whatever they end up holding. Everything here works on plan items (dicts with "x", "y",
+"width" and "height", x/y being the top-left corner within the frame) and makes no
+API calls.
+"""
+
+import math
+import textwrap
+
+# Clearance left between an element and the one it was pushed below, and between
+# repeated rows or grid cells
+GAP = 20
+# Space kept between a frame's contents and its right and bottom edges
+MARGIN = 40
+# Sticky notes have a fixed aspect ratio; the rectangle shape is 350 x 228 at default size
+STICKY_HEIGHT_RATIO = 228 / 350
+# Text metrics, as fractions of the font size: average glyph width and line height
+CHAR_WIDTH = 0.5
+LINE_HEIGHT = 1.4
+# Side of a spatial index cell, in board units
+CELL = 200
+
+
+def wrap(content, width, font_size):
+    """Lines of `content` word-wrapped to a box `width` wide, using the same glyph estimate."""
+    per_line = max(1, int(width / (font_size * CHAR_WIDTH)))
+    lines = []
+    for paragraph in content.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, per_line) or [""])
+    return lines
+
+
+def text_height(content, width, font_size):
+    """Estimated height of wrapped text in a box `width` wide."""
+    per_line = max(1, int(width / (font_size * CHAR_WIDTH)))
+    lines = sum(max(1, math.ceil(len(line) / per_line)) for line in content.split("\n"))
+    return math.ceil(lines * font_size * LINE_HEIGHT)
+
+
+def measure(item):
+    """Set the item's "height" from its content if the API decides it (text, sticky note)."""
+    if item["type"] == "text":
+        item["height"] = text_height(item["content"], item["width"], item["font_size"])
+    elif item["type"] == "sticky_note":
+        item["height"] = math.ceil(item["width"] * STICKY_HEIGHT_RATIO)
+    return item
+
+
+def bounds(items):
+    """(left, top, right, bottom) around `items`, or None when there are none."""
+    if not items:
+        return None
+    return (
+        min(i["x"] for i in items),
+        min(i["y"] for i in items),
+        max(i["x"] + i["width"] for i in items),
+        max(i["y"] + i["height"] for i in items),
+    )
+
+
+def shift(items, dx=0, dy=0):
+    for item in items:
+        item["x"] += dx
+        item["y"] += dy
+
+
+def intersects(a, b):
+    return (a["x"] < b["x"] + b["width"] and b["x"] < a["x"] + a["width"]
+            and a["y"] < b["y"] + b["height"] and b["y"] < a["y"] + a["height"])
+
+
+class SpatialIndex:
+    """Uniform grid of CELL-sized buckets, so a collision check only looks at nearby items."""
+
+    def __init__(self, cell=CELL):
+        self.cell = cell
+        self.buckets = {}
+
+    def _cells(self, item):
+        c = self.cell
+        for cx in range(math.floor(item["x"] / c), math.floor((item["x"] + item["width"]) / c) + 1):
+            for cy in range(math.floor(item["y"] / c), math.floor((item["y"] + item["height"]) / c) + 1):
+                yield cx, cy
+
+    def add(self, item):
+        for cell in self._cells(item):
+            self.buckets.setdefault(cell, []).append(item)
+
+    def query(self, item):
+        """Indexed items overlapping `item`."""
+        hits = {}
+        for cell in self._cells(item):
+            for other in self.buckets.get(cell, ()):
+                if other is not item and intersects(item, other):
+                    hits[id(other)] = other
+        return list(hits.values())
+
+
+class Flow:
+    """Places blocks of items one after another, moving each down until it overlaps nothing."""
+
+    def __init__(self):
+        self.index = SpatialIndex()
+
+    def place(self, items):
+        """Move `items` down as a block until they clear everything placed. Returns the move."""
+        moved = 0
+        while True:
+            push = 0
+            for item in items:
+                for other in self.index.query(item):
+                    push = max(push, other["y"] + other["height"] + GAP - item["y"])
+            if not push:
+                break
+            shift(items, dy=push)
+            moved += push
+        for item in items:
+            self.index.add(item)
+        return moved
+
+
+def fit_cover(shape, declared, covered_before, covered_after):
+    """Stretch a cover shape over what it covers, keeping the margins it was drawn with.
+
+    `declared` is the shape's own box as written in the spec, and `covered_before` and
+    `covered_after` the bounds of the covered items before and after they were placed.
+    Margins never drop below GAP / 2, so a cover always overlaps what it hides.
+    """
+    before = _union(covered_before)
+    after = _union(covered_after)
+    if not before or not after:
+        return
+    left = max(GAP // 2, before[0] - declared[0])
+    top = max(GAP // 2, before[1] - declared[1])
+    right = max(GAP // 2, declared[2] - before[2])
+    bottom = max(GAP // 2, declared[3] - before[3])
+    shape["x"] = after[0] - left
+    shape["y"] = after[1] - top
+    shape["width"] = after[2] - after[0] + left + right
+    shape["height"] = after[3] - after[1] + top + bottom
+
+
+def _union(boxes):
+    boxes = [b for b in boxes if b]
+    if not boxes:
+        return None
+    return min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes)
+
+
+def overlaps(items):
+    """Pairs of solid items that overlap, found through the spatial index."""
+    index = SpatialIndex()
+    pairs = []
+    for item in items:
+        if item.get("overlay"):
+            continue
+        pairs.extend((other, item) for other in index.query(item))
+        index.add(item)
+    return pairs
@@ -0,0 +1,367 @@
+"""
+Miro REST API transport shared by the facilitator board scripts.
+
+MiroClient owns one pooled, keep-alive requests.Session, so every call after the
+first reuses an open TCP/TLS connection instead of handshaking again. All calls go
+through a token-bucket RateLimiter that follows Miro's rate-limit headers, and
+429 / 5xx / network errors are retried with jittered exponential backoff. A create
+(POST) is only sent again when it cannot have been applied (a 429, or a connection that
+was never made); after a 5xx or a lost response, the items are looked for on the board
+first and only the ones missing are sent again, so a retry never adds a duplicate. Give
+it a tracing.Trace to record every call (endpoint, zone, status, time, retries, bytes).
+
+Install: pip install requests
+"""
+
+import html
+import random
+import re
+import sys
+import threading
+import time
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import NewConnectionError
+except ImportError:
+    print("Install requests: pip install requests", file=sys.stderr)
+    sys.exit(1)
+
+BASE = "https://api.miro.com/v2"
+# Miro rate limit: credits per minute per user, and the cost of one create call (Level 2)
+RATE_LIMIT_CREDITS = 100000
+REQUEST_COST = 100
+# Retries for 429 / 5xx / network errors, with jittered exponential backoff
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+# (connect, read) timeouts in seconds
+TIMEOUT = (5, 30)
+# Most items one bulk create call accepts
+BULK_LIMIT = 20
+
+
+class RateLimiter:
+    """Token bucket shared by every API call, kept in step with Miro's rate-limit headers.
+
+    Calls go out at full speed while credits remain. Each response resyncs the bucket
+    from X-RateLimit-Remaining / X-RateLimit-Reset, and a Retry-After pauses every
+    caller until the window reopens.
+    """
+
+    def __init__(self, credits_per_minute=RATE_LIMIT_CREDITS):
+        self.capacity = float(credits_per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waited = 0.0  # total seconds callers have spent blocked, for run summaries
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, cost=REQUEST_COST):
+        """Block until `cost` credits are available, then spend them. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= cost:
+                        self.tokens -= cost
+                        self.waited += waited
+                        return waited
+                    wait = (cost - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def update(self, response, cost=REQUEST_COST):
+        """Resync from a response's rate-limit headers."""
+        h = response.headers
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            limit = h.get("X-RateLimit-Limit")
+            if limit:
+                self.capacity = float(limit)
+                self.rate = self.capacity / 60.0
+            remaining = h.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                self.tokens = min(self.tokens, float(remaining))
+                reset = h.get("X-RateLimit-Reset")
+                if reset and float(remaining) < cost:
+                    self.blocked_until = max(self.blocked_until, now + max(0.0, float(reset) - time.time()))
+            retry_after = h.get("Retry-After")
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + float(retry_after))
+
+
+def _retryable(response):
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _unsent(error):
+    """Whether a network error happened while connecting, before any of the request was sent."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    return isinstance(getattr(error.args[0], "reason", None) if error.args else None, NewConnectionError)
+
+
+class UnconfirmedCreate(requests.RequestException):
+    """A create call failed in a way that leaves open whether Miro applied it."""
+
+
+class MiroClient:
+    """Pooled Miro REST client. Safe to share between worker threads.
+
+    `pool_size` should be at least the number of threads calling the client at once,
+    otherwise connections are discarded and re-opened under load. `calls` and `retries`
+    count requests sent and requests re-sent, for benchmarks and run summaries. With a
+    `trace`, every call is also recorded there once it completes or fails.
+    """
+
+    def __init__(self, token, base=BASE, pool_size=10, limiter=None, trace=None):
+        self.base = base.rstrip("/")
+        self.limiter = limiter or RateLimiter()
+        self.trace = trace
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.calls = 0
+        self.retries = 0
+        self.stats_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def request(self, method, path, body=None, zone=None):
+        """Send one API call through the limiter, retrying 429, 5xx and network errors.
+
+        A POST is retried only when it cannot have been applied: on a 429, or a network
+        error before the connection was made. A 5xx or any other network error raises
+        UnconfirmedCreate instead; the create_* methods then look for the items on the
+        board before sending them again. `zone` only labels the call in the trace.
+        """
+        call = {"method": method, "endpoint": _endpoint(path), "zone": zone, "start": time.time(), "status": None,
+                "retries": 0, "waited": 0.0, "network": 0.0, "backoff": 0.0, "bytes_out": 0, "bytes_in": 0}
+        started = time.monotonic()
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                with self.stats_lock:
+                    self.calls += 1
+                    self.retries += attempt > 0
+                call["retries"] = attempt
+                call["waited"] += self.limiter.acquire()
+                sent = time.monotonic()
+                try:
+                    r = self.session.request(method, f"{self.base}{path}", json=body, timeout=TIMEOUT)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    call["network"] += time.monotonic() - sent
+                    call["status"] = None
+                    if method == "POST" and not _unsent(e):
+                        raise UnconfirmedCreate(f"POST {path}: {e}") from e
+                    if attempt == MAX_RETRIES:
+                        raise
+                else:
+                    call["network"] += time.monotonic() - sent
+                    call["status"] = r.status_code
+                    call["bytes_out"] += len(r.request.body or b"")
+                    call["bytes_in"] += len(r.content)
+                    self.limiter.update(r)
+                    if method == "POST" and r.status_code >= 500:
+                        raise UnconfirmedCreate(f"POST {path}: {r.status_code}", response=r)
+                    if not _retryable(r) or attempt == MAX_RETRIES:
+                        r.raise_for_status()
+                        return r.json() if r.content else {}
+                    if r.headers.get("Retry-After"):
+                        continue  # the limiter now holds every caller until the window reopens
+                pause = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                time.sleep(pause)
+                call["backoff"] += pause
+        finally:
+            if self.trace:
+                call["latency"] = time.monotonic() - started
+                self.trace.record(call)
+
+    # -------------------------------------------------------------------------
+    # Boards and items
+    # -------------------------------------------------------------------------
+    def create_board(self, name, description="", team_id=None):
+        body = {"name": name[:60], "description": description}
+        if team_id:
+            body["teamId"] = team_id
+        return self.request("POST", "/boards", body, zone="board")["id"]
+
+    def create_item(self, board_id, item, parent_id=None):
+        """Create one plan item (see item_body) and return its Miro ID."""
+        def send(items):
+            path = f"/boards/{board_id}/{ENDPOINTS[item['type']]}"
+            return [self.request("POST", path, item_body(item, parent_id), zone=_zone(item))["id"]]
+
+        return self._create(board_id, [item], parent_id, send)[0]
+
+    def create_items(self, board_id, items, parent_id=None):
+        """Create up to BULK_LIMIT plan items in one call and return their Miro IDs in order."""
+        def send(items):
+            body = [dict(item_body(item, parent_id), type=item["type"]) for item in items]
+            created = self.request("POST", f"/boards/{board_id}/items/bulk", body, zone=_zone(items[0]))["data"]
+            return [item["id"] for item in created]
+
+        return self._create(board_id, items, parent_id, send)
+
+    def _create(self, board_id, items, parent_id, send):
+        """Miro IDs for `items`, created by `send(items)`. When a send is unconfirmed, the
+        items already on the board (see find_created) are kept and only the rest sent again."""
+        ids = [None] * len(items)
+        for attempt in range(MAX_RETRIES + 1):
+            todo = [i for i, item_id in enumerate(ids) if item_id is None]
+            try:
+                for i, item_id in zip(todo, send([items[i] for i in todo])):
+                    ids[i] = item_id
+                return ids
+            except UnconfirmedCreate:
+                if attempt == MAX_RETRIES:
+                    raise
+            time.sleep(random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)))
+            for i, item_id in zip(todo, self.find_created(board_id, [items[i] for i in todo], parent_id)):
+                ids[i] = item_id
+            if all(ids):
+                return ids
+
+    def find_created(self, board_id, items, parent_id=None):
+        """The Miro ID of each plan item that is already on the board, or None, in order.
+
+        Looks through the children of `parent_id` (the frames, without one) for an item
+        of the same type, content and position, as item_body would create it.
+        """
+        live = list(self.list_items(board_id, "frame" if parent_id is None else None, parent_id))
+        found = []
+        for item in items:
+            body = item_body(item, parent_id)
+            match = next((entry for entry in live if _same(entry, item["type"], body)), None)
+            if match:
+                live.remove(match)
+            found.append(match and match["id"])
+        return found
+
+    def update_item(self, board_id, item_id, item, parent_id=None):
+        path = f"/boards/{board_id}/{ENDPOINTS[item['type']]}/{item_id}"
+        self.request("PATCH", path, item_body(item, parent_id), zone=_zone(item))
+
+    def delete_item(self, board_id, item_id, zone=None):
+        self.request("DELETE", f"/boards/{board_id}/items/{item_id}", zone=zone)
+
+    def list_pages(self, board_id, item_type=None, parent_id=None, page_size=50):
+        """Yield pages (lists) of board items, following the cursor from page to page.
+
+        `item_type` limits the listing to one type (e.g. "frame"); `parent_id` to the
+        children of one frame.
+        """
+        cursor = None
+        while True:
+            path = f"/boards/{board_id}/items?limit={page_size}"
+            if item_type:
+                path += f"&type={item_type}"
+            if parent_id:
+                path += f"&parent_item_id={parent_id}"
+            if cursor:
+                path += f"&cursor={cursor}"
+            page = self.request("GET", path)
+            yield page.get("data", [])
+            cursor = page.get("cursor")
+            if not cursor:
+                return
+
+    def list_items(self, board_id, item_type=None, parent_id=None, page_size=50):
+        """Yield every item on the board (see list_pages for the filters)."""
+        for page in self.list_pages(board_id, item_type, parent_id, page_size):
+            yield from page
+
+
+# Plan item type -> REST collection
+ENDPOINTS = {"frame": "frames", "text": "texts", "sticky_note": "sticky_notes", "shape": "shapes"}
+
+
+def _endpoint(path):
+    """The path with its IDs and query taken out, e.g. "/boards/{id}/texts/{id}", for grouping calls."""
+    path = re.sub(r"^/boards/[^/?]+", "/boards/{id}", path.split("?")[0])
+    return re.sub(r"^(/boards/\{id\}/[a-z_]+)/(?!bulk$)[^/]+", r"\1/{id}", path)
+
+
+def _zone(item):
+    """The plan zone an item belongs to; a frame is its own zone."""
+    return item.get("zone") or item.get("key")
+
+
+def item_body(item, parent_id=None):
+    """Request body for a plan item.
+
+    A plan item is a dict with a "type" (frame, text, sticky_note or shape), "x", "y",
+    "width" and "height", and per type: "title" (frame); "content", "font_size" and
+    "color" (text); "content" (sticky_note and shape); plus an optional "fill_color".
+    With a `parent_id`, x/y are the item's top-left corner within the parent frame and are
+    converted to the centre Miro positions items by; otherwise they are the board
+    position of its centre. Text and sticky note heights are estimates (Miro sizes those
+    from the content), so only their width is sent.
+    """
+    kind = item["type"]
+    body = {"position": _position(item, parent_id), "geometry": {"width": item["width"]}}
+    if kind == "frame":
+        body["data"] = {"title": item["title"][:6000], "format": "custom", "type": "freeform"}
+        body["geometry"]["height"] = item["height"]
+        if item.get("fill_color"):
+            body["style"] = {"fillColor": item["fill_color"]}
+    elif kind == "text":
+        body["data"] = {"content": item["content"][:65000]}
+        body["style"] = {"fontSize": str(item["font_size"]), "color": item["color"]}
+        if item.get("fill_color"):
+            body["style"]["fillColor"] = item["fill_color"]
+            body["style"]["fillOpacity"] = "1.0"
+    elif kind == "sticky_note":
+        body["data"] = {"content": item["content"][:65000], "shape": "rectangle"}
+        body["style"] = {"fillColor": item["fill_color"]}
+    elif kind == "shape":
+        body["data"] = {"shape": "rectangle", "content": item.get("content", "")}
+        body["geometry"]["height"] = item["height"]
+        body["style"] = {"fillColor": item["fill_color"]}
+    else:
+        raise ValueError(f"Unknown item type: {kind}")
+    if parent_id:
+        body["parent"] = {"id": str(parent_id)}
+    return body
+
+
+def plain_text(content):
+    """Item text without Miro's HTML markup."""
+    text = re.sub(r"<br\s*/?>|</p>\s*<p>", "\n", content or "")
+    return html.unescape(re.sub(r"<[^>]+>", "", text)).strip()
+
+
+def _same(entry, kind, body):
+    """Whether a listed board item is what `body` (see item_body) for a `kind` item creates."""
+    data, want, have = entry.get("data") or {}, body["data"], entry.get("position") or {}
+    field = "title" if kind == "frame" else "content"
+    return (entry.get("type") == kind
+            and plain_text(data.get(field)) == plain_text(want.get(field))
+            and all(abs(float(have.get(axis, "nan")) - body["position"][axis]) <= 1 for axis in ("x", "y"))
+            and (kind != "shape" or str((entry.get("style") or {}).get("fillColor", "")).lower()
+                 == str(body["style"]["fillColor"]).lower()))
+
+
+def _position(item, parent_id):
+    if not parent_id:
+        return {"x": item["x"], "y": item["y"]}
+    return {"x": item["x"] + item["width"] / 2, "y": item["y"] + item["height"] / 2, "relativeTo": "parent_top_left"}
@@ -0,0 +1,207 @@
+"""
+Offline preview of the workshop board: renders the compiled plan to SVG or HTML.
+
+PreviewBoard has the create, update and delete methods of MiroClient that build_board
+uses, so `build-miro-board.py preview` runs the very same build against it. Nothing
+goes over the network: each item is kept as the request body Miro would have been sent
+(centre positions relative to its frame, widths, colours, content), and the whole board
+is then drawn as one SVG. The HTML version wraps that SVG in a page with wheel zoom,
+drag to pan and a button per frame.
+
+Text and sticky note heights are estimated with layout.py, as Miro sizes those itself,
+so wrapping in the preview is close to, not identical with, the real board.
+"""
+
+import html
+import itertools
+import threading
+
+import layout
+from miro import item_body
+
+# Miro's named sticky note colours
+STICKY_COLORS = {
+    "gray": "#e6e6e6", "light_yellow": "#fff9b1", "yellow": "#f5d128", "orange": "#ff9d48",
+    "light_green": "#d5f692", "green": "#c9df56", "dark_green": "#93d275", "cyan": "#67c6c0",
+    "light_pink": "#ffcee0", "pink": "#ea94bb", "violet": "#c6a2d2", "red": "#f0939d",
+    "light_blue": "#a6ccf5", "blue": "#6cd8fa", "dark_blue": "#9ea9ff", "black": "#000000",
+}
+FONT = "Helvetica, Arial, sans-serif"
+STICKY_FONT_SIZE = 14
+TITLE_FONT_SIZE = 28
+# Padding inside sticky notes and shapes
+PAD = 10
+
+
+class PreviewBoard:
+    """In-memory board that build_board can target in place of a MiroClient."""
+
+    def __init__(self):
+        self.name = ""
+        self.items = {}  # ID -> (type, request body); IDs count up in creation order
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def create_board(self, name, description="", team_id=None):
+        self.name = name
+        return "preview"
+
+    def create_item(self, board_id, item, parent_id=None):
+        with self.lock:
+            item_id = str(next(self.ids))
+            self.items[item_id] = (item["type"], item_body(item, parent_id))
+        return item_id
+
+    def create_items(self, board_id, items, parent_id=None):
+        return [self.create_item(board_id, item, parent_id) for item in items]
+
+    def update_item(self, board_id, item_id, item, parent_id=None):
+        with self.lock:
+            self.items[item_id] = (item["type"], item_body(item, parent_id))
+
+    def delete_item(self, board_id, item_id, zone=None):
+        with self.lock:
+            self.items.pop(item_id, None)
+
+    # -------------------------------------------------------------------------
+    # Rendering
+    # -------------------------------------------------------------------------
+    def _boxes(self):
+        """(type, body, left, top, width, height) for every item, frames first, then by creation."""
+        frames = {}
+        for item_id, (kind, body) in self.items.items():
+            if kind == "frame":
+                g, p = body["geometry"], body["position"]
+                frames[item_id] = (p["x"] - g["width"] / 2, p["y"] - g["height"] / 2)
+        boxes = []
+        for item_id, (kind, body) in sorted(self.items.items(), key=lambda e: (e[1][0] != "frame", int(e[0]))):
+            width = body["geometry"]["width"]
+            height = _height(kind, body)
+            x, y = body["position"]["x"], body["position"]["y"]
+            parent = body.get("parent", {}).get("id")
+            if parent in frames:
+                x, y = x + frames[parent][0], y + frames[parent][1]
+            boxes.append((kind, body, x - width / 2, y - height / 2, width, height))
+        return boxes
+
+    def svg(self):
+        """The board as a standalone SVG document."""
+        boxes = self._boxes()
+        if not boxes:
+            return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"></svg>\n'
+        left = min(b[2] for b in boxes) - 100
+        top = min(b[3] for b in boxes) - 100 - TITLE_FONT_SIZE * 2
+        right = max(b[2] + b[4] for b in boxes) + 100
+        bottom = max(b[3] + b[5] for b in boxes) + 100
+        out = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{left:.0f} {top:.0f} {right - left:.0f} {bottom - top:.0f}" '
+            f'font-family="{FONT}">',
+            f'<rect x="{left:.0f}" y="{top:.0f}" width="{right - left:.0f}" height="{bottom - top:.0f}" fill="#f2f2f2"/>',
+        ]
+        for kind, body, x, y, w, h in boxes:
+            out.extend(_draw(kind, body, x, y, w, h))
+        out.append("</svg>")
+        return "\n".join(out) + "\n"
+
+    def html(self):
+        """The board as a self-contained HTML page with zoom, pan and frame navigation."""
+        buttons = []
+        for kind, body, x, y, w, h in self._boxes():
+            if kind == "frame":
+                title = html.escape(body["data"]["title"])
+                box = f"{x - 40:.0f},{y - 40 - TITLE_FONT_SIZE * 2:.0f},{w + 80:.0f},{h + 80 + TITLE_FONT_SIZE * 2:.0f}"
+                buttons.append(f'<button onclick="show({box})">{title}</button>')
+        return _PAGE.format(title=html.escape(self.name or "Board preview"), buttons="\n".join(buttons), svg=self.svg())
+
+
+def _height(kind, body):
+    g = body["geometry"]
+    if "height" in g:
+        return g["height"]
+    if kind == "sticky_note":
+        return g["width"] * layout.STICKY_HEIGHT_RATIO
+    return layout.text_height(body["data"]["content"], g["width"], int(body["style"]["fontSize"]))
+
+
+def _text(content, x, y, width, font_size, color, anchor="start"):
+    lines = layout.wrap(content, width, font_size)
+    tx = x + width / 2 if anchor == "middle" else x
+    spans = "".join(
+        f'<tspan x="{tx:.0f}" dy="{font_size * (1 if i == 0 else layout.LINE_HEIGHT):.1f}">{html.escape(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return f'<text y="{y:.0f}" font-size="{font_size}" fill="{color}" text-anchor="{anchor}">{spans}</text>'
+
+
+def _draw(kind, body, x, y, w, h):
+    style, data = body.get("style", {}), body.get("data", {})
+    box = f'x="{x:.0f}" y="{y:.0f}" width="{w:.0f}" height="{h:.0f}"'
+    if kind == "frame":
+        return [
+            f'<rect {box} fill="{style.get("fillColor", "#ffffff")}" stroke="#c8c8c8" stroke-width="2"/>',
+            f'<text x="{x:.0f}" y="{y - TITLE_FONT_SIZE * 0.6:.0f}" font-size="{TITLE_FONT_SIZE}" fill="#555555">'
+            f'{html.escape(data["title"])}</text>',
+        ]
+    if kind == "text":
+        parts = []
+        if style.get("fillColor"):
+            parts.append(f'<rect {box} fill="{style["fillColor"]}"/>')
+        parts.append(_text(data["content"], x, y, w, int(style["fontSize"]), style.get("color", "#1a1a1a")))
+        return parts
+    if kind == "sticky_note":
+        fill = STICKY_COLORS.get(style.get("fillColor"), style.get("fillColor", "#fff9b1"))
+        return [
+            f'<rect {box} fill="{fill}" stroke="#00000022"/>',
+            _text(data.get("content", ""), x + PAD, y + PAD, w - 2 * PAD, STICKY_FONT_SIZE, "#1a1a1a"),
+        ]
+    parts = [f'<rect {box} fill="{style.get("fillColor", "#ffffff")}"/>']
+    if data.get("content"):
+        parts.append(_text(data["content"], x + PAD, y + PAD, w - 2 * PAD, STICKY_FONT_SIZE, "#1a1a1a", "middle"))
+    return parts
+
+
+_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  html, body {{ margin: 0; height: 100%; font-family: Helvetica, Arial, sans-serif; }}
+  nav {{ position: fixed; top: 0; left: 0; right: 0; padding: 6px; background: #ffffffee; border-bottom: 1px solid #ddd; }}
+  nav button {{ margin: 2px; }}
+  svg {{ width: 100%; height: 100%; display: block; cursor: grab; }}
+</style>
+</head>
+<body>
+<nav><button onclick="show(...home)">Whole board</button>
+{buttons}
+<span>Scroll to zoom, drag to pan.</span></nav>
+{svg}
+<script>
+const svg = document.querySelector("svg");
+const vb = svg.viewBox.baseVal;
+const home = [vb.x, vb.y, vb.width, vb.height];
+function show(x, y, w, h) {{ vb.x = x; vb.y = y; vb.width = w; vb.height = h; }}
+function scale() {{ return Math.max(vb.width / svg.clientWidth, vb.height / svg.clientHeight); }}
+function point(e) {{
+  const s = scale(), r = svg.getBoundingClientRect();
+  return [vb.x + vb.width / 2 + (e.clientX - r.left - r.width / 2) * s, vb.y + vb.height / 2 + (e.clientY - r.top - r.height / 2) * s];
+}}
+svg.addEventListener("wheel", e => {{
+  e.preventDefault();
+  const k = e.deltaY > 0 ? 1.15 : 1 / 1.15, [px, py] = point(e);
+  show(px - (px - vb.x) * k, py - (py - vb.y) * k, vb.width * k, vb.height * k);
+}}, {{ passive: false }});
+let drag = null;
+svg.addEventListener("pointerdown", e => {{ drag = [e.clientX, e.clientY]; svg.setPointerCapture(e.pointerId); }});
+svg.addEventListener("pointerup", () => {{ drag = null; }});
+svg.addEventListener("pointermove", e => {{
+  if (!drag) return;
+  const s = scale();
+  vb.x -= (e.clientX - drag[0]) * s; vb.y -= (e.clientY - drag[1]) * s;
+  drag = [e.clientX, e.clientY];
+}});
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the parts of the Miro REST API the board scripts use.
+
+Lets build-miro-board.py run, and be timed, without a Miro token or network. It keeps
+boards in memory and serves: create board; create frames, texts, sticky_notes and
+shapes; bulk create; list items (cursor pagination, by type or parent frame); update
+and delete items. It can add latency, enforce a credit budget with Miro's rate-limit
+headers, and inject random 429s and 500s, including 500s for item creates it has
+applied.
+
+Usage:
+  python standin.py --port 8765 --latency 0.05 --throttle-rate 0.02
+  MIRO_API_BASE=http://127.0.0.1:8765/v2 MIRO_ACCESS_TOKEN=x python build-miro-board.py
+
+In code (as `build-miro-board.py bench` does):
+  with StandIn(latency=0.05) as server:
+      client = MiroClient("x", base=server.url)
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from miro import RATE_LIMIT_CREDITS, REQUEST_COST
+
+COLLECTIONS = {"frames": "frame", "texts": "text", "sticky_notes": "sticky_note", "shapes": "shape"}
+# Credits per call, roughly following Miro's rate-limit levels
+LIST_COST = 50
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class StandIn(ThreadingHTTPServer):
+    """In-memory Miro stand-in. Serves on a background thread between start() and stop().
+
+    `latency` (plus up to `jitter`) seconds are added to every response. `credits` per
+    minute are enforced like Miro's quota, with X-RateLimit-* headers and 429 plus
+    Retry-After once spent. `throttle_rate` and `error_rate` are the fractions of calls
+    answered with a spurious 429 or a 500. `lost_rate` is the fraction of item creates
+    that are applied but answered with a 500, as when Miro fails after writing or the
+    response is lost.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, credits=RATE_LIMIT_CREDITS,
+                 throttle_rate=0.0, error_rate=0.0, seed=None, lost_rate=0.0):
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.credits = credits
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.lost_rate = lost_rate
+        self.random = random.Random(seed)
+        self.boards = {}  # board ID -> {item ID: item}
+        self.ids = itertools.count(3458764500000000001)
+        self.lock = threading.Lock()
+        self.window_start = time.time()
+        self.spent = 0
+        self.requests = 0
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def next_id(self):
+        return str(next(self.ids))
+
+    def charge(self, cost):
+        """Spend credits in the current one-minute window. Returns (ok, headers)."""
+        with self.lock:
+            self.requests += 1
+            now = time.time()
+            if now - self.window_start >= 60:
+                self.window_start, self.spent = now, 0
+            ok = self.spent + cost <= self.credits
+            if ok:
+                self.spent += cost
+            reset = int(self.window_start + 60)
+            headers = {
+                "X-RateLimit-Limit": str(self.credits),
+                "X-RateLimit-Remaining": str(self.credits - self.spent),
+                "X-RateLimit-Reset": str(reset),
+            }
+            if not ok:
+                headers["Retry-After"] = str(max(1, int(reset - now + 0.999)))
+            return ok, headers
+
+    def fault(self):
+        """A random 429 or 500 for this call, or None."""
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+    def lost(self):
+        """Whether to answer this applied create with a 500."""
+        with self.lock:
+            return self.random.random() < self.lost_rate
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandIn
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def _handle(self, method):
+        server = self.server
+        body = self._body()
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.random.uniform(0, server.jitter))
+        ok, headers = server.charge(LIST_COST if method == "GET" else REQUEST_COST)
+        if not ok:
+            return self._send(429, {"status": 429, "message": "Rate limit exceeded"}, headers)
+        fault = server.fault()
+        if fault == 429:
+            return self._send(429, {"status": 429, "message": "Too many requests"}, dict(headers, **{"Retry-After": "1"}))
+        if fault:
+            return self._send(fault, {"status": fault, "message": "Injected failure"}, headers)
+        path, _, query = self.path.partition("?")
+        try:
+            status, payload = _route(server, method, path, query, body)
+        except KeyError:
+            status, payload = 404, {"status": 404, "message": "Not found"}
+        if method == "POST" and path != "/v2/boards" and status < 400 and server.lost():
+            status, payload = 500, {"status": 500, "message": "Injected failure after the create"}
+        self._send(status, payload, headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def _item(server, kind, body):
+    now = _now()
+    item = {"id": server.next_id(), "type": kind, "createdAt": now, "modifiedAt": now}
+    for field in ("data", "style", "position", "geometry", "parent"):
+        if field in body:
+            item[field] = body[field]
+    return item
+
+
+def _route(server, method, path, query, body):
+    m = re.fullmatch(r"/v2/boards(?:/([^/]+)(?:/([a-z_]+)(?:/([^/]+))?)?)?", path)
+    if not m:
+        raise KeyError(path)
+    board_id, collection, item_id = m.groups()
+    if board_id is None and method == "POST":
+        board_id = server.next_id()
+        now = _now()
+        board = {"id": board_id, "type": "board", "name": body.get("name", ""), "description": body.get("description", ""),
+                 "createdAt": now, "modifiedAt": now}
+        with server.lock:
+            server.boards[board_id] = {}
+        return 201, board
+
+    items = server.boards[board_id]
+    if collection == "items" and item_id == "bulk" and method == "POST":
+        created = []
+        for entry in body:
+            entry = dict(entry)
+            created.append(_item(server, entry.pop("type"), entry))
+        with server.lock:
+            items.update((item["id"], item) for item in created)
+        return 201, {"data": created, "type": "bulk-list"}
+    if collection == "items" and item_id is None and method == "GET":
+        params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+        limit = min(50, int(params.get("limit", 10)))
+        start = int(params.get("cursor") or 0)
+        with server.lock:
+            matches = [
+                item for item in items.values()
+                if params.get("type") in (None, item["type"])
+                and params.get("parent_item_id") in (None, item.get("parent", {}).get("id"))
+            ]
+        page = matches[start:start + limit]
+        more = start + limit < len(matches)
+        return 200, {"data": page, "cursor": str(start + limit) if more else None, "limit": limit, "size": len(page)}
+    if collection == "items" and item_id and method == "DELETE":
+        with server.lock:
+            del items[item_id]
+        return 204, None
+    kind = COLLECTIONS[collection]
+    if item_id is None and method == "POST":
+        item = _item(server, kind, body)
+        with server.lock:
+            items[item["id"]] = item
+        return 201, item
+    if item_id and method == "PATCH":
+        with server.lock:
+            item = items[item_id]
+            for field in ("data", "style", "position", "geometry", "parent"):
+                if field in body:
+                    item[field] = body[field]
+            item["modifiedAt"] = _now()
+        return 200, item
+    if item_id and method == "GET":
+        return 200, items[item_id]
+    raise KeyError(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve an in-memory stand-in for the Miro REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds per response")
+    parser.add_argument("--credits", type=int, default=RATE_LIMIT_CREDITS, help="rate-limit credits per minute")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of calls answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered 500")
+    parser.add_argument("--lost-rate", type=float, default=0.0, help="fraction of item creates applied but answered 500")
+    parser.add_argument("--seed", type=int, help="seed for injected faults")
+    args = parser.parse_args(argv)
+    server = StandIn(args.host, args.port, args.latency, args.jitter, args.credits, args.throttle_rate, args.error_rate,
+                     args.seed, args.lost_rate)
+    print(f"Miro stand-in listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
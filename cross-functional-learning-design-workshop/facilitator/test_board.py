@@ -0,0 +1,123 @@
+"""
+Build, resume, sync and reset a board against standin.py, with throttling and errors on.
+
+Run from this folder: python -m pytest -q
+"""
+
+import copy
+import importlib.util
+import os
+
+import pytest
+
+from miro import MiroClient, RateLimiter
+from standin import StandIn
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location("build_miro_board", os.path.join(HERE, "build-miro-board.py"))
+board = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(board)
+
+PARTICIPANTS, TEAMS = 2, 1
+CREDITS = 100_000
+
+
+@pytest.fixture
+def server():
+    with StandIn(credits=CREDITS, throttle_rate=0.03, error_rate=0.03, seed=7) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with MiroClient("stand-in", base=server.url, pool_size=4, limiter=RateLimiter(CREDITS)) as client:
+        yield client
+
+
+def _plan(spec=None):
+    return board.compile_plan(spec or board.load_spec(), participants=PARTICIPANTS, teams=TEAMS)
+
+
+def _build(client, path, plan):
+    journal = board.Journal(path)
+    try:
+        board_id = journal.record("board", client.create_board(plan["board"]["name"]))
+        counts = board.build_board(client, journal, board_id, plan, workers=4)
+    finally:
+        journal.close()
+    return board_id, counts
+
+
+def test_build_then_resume_does_nothing(server, client, tmp_path):
+    plan = _plan()
+    path = str(tmp_path / "journal.jsonl")
+    board_id, counts = _build(client, path, plan)
+    assert counts["create"] == len(plan["zones"]) + len(plan["items"])
+    assert len(server.boards[board_id]) == counts["create"]
+    assert client.retries > 0
+
+    journal = board.Journal(path, resume=True)
+    try:
+        counts = board.build_board(client, journal, board_id, plan, workers=4)
+    finally:
+        journal.close()
+    assert counts["create"] == counts["update"] == 0
+    assert len(server.boards[board_id]) == len(plan["zones"]) + len(plan["items"])
+
+
+def test_sync_sends_one_update_and_the_deletes(server, client, tmp_path):
+    spec = board.load_spec()
+    path = str(tmp_path / "journal.jsonl")
+    board_id, _ = _build(client, path, _plan(spec))
+
+    edited = copy.deepcopy(spec)
+    phase_1 = next(zone for zone in edited["zones"] if zone["key"] == "phase-1")
+    prompt = next(item for item in phase_1["items"] if item["id"] == "prompt-1a")
+    prompt["content"] = "Define learning in a single sentence."
+    phase_1["items"] = [item for item in phase_1["items"] if item["id"] != "answers-1b"]
+    plan = _plan(edited)
+    removed = [item for item in _plan(spec)["items"] if item["key"].startswith("phase-1/answers-1b.")]
+
+    _, counts = board.sync_board(client, path, plan, workers=4)
+    assert counts["update"] == 1
+    assert counts["delete"] == len(removed) > 0
+    assert counts["create"] == 0
+    assert len(server.boards[board_id]) == len(plan["zones"]) + len(plan["items"])
+
+    _, counts = board.sync_board(client, path, plan, workers=4)
+    assert board._summary(counts) == f"{len(plan['zones']) + len(plan['items'])} unchanged"
+
+
+def test_reset_restores_covers_once(server, client, tmp_path):
+    plan = _plan()
+    path = str(tmp_path / "journal.jsonl")
+    board_id, _ = _build(client, path, plan)
+
+    journal = board.Journal(path, resume=True)
+    covers = [journal.get(item["key"]) for item in plan["items"] if board._is_cover(item)]
+    journal.close()
+    assert covers
+    for cover_id in covers:
+        del server.boards[board_id][cover_id]
+
+    _, counts = board.reset_board(client, path, plan, workers=4)
+    assert counts["create"] >= len(covers)
+    journal = board.Journal(path, resume=True)
+    try:
+        for item in plan["items"]:
+            assert journal.get(item["key"]) in server.boards[board_id], item["key"]
+    finally:
+        journal.close()
+    assert len(server.boards[board_id]) == len(plan["zones"]) + len(plan["items"])
+
+    _, counts = board.reset_board(client, path, plan, workers=4)
+    assert board._summary(counts) == "nothing to do"
+
+
+def test_lost_create_responses_leave_no_duplicates(tmp_path):
+    plan = _plan()
+    with StandIn(credits=CREDITS, error_rate=0.03, lost_rate=0.1, seed=11) as server:
+        with MiroClient("stand-in", base=server.url, pool_size=4, limiter=RateLimiter(CREDITS)) as client:
+            board_id, counts = _build(client, str(tmp_path / "journal.jsonl"), plan)
+    assert counts["create"] == len(plan["zones"]) + len(plan["items"])
+    assert len(server.boards[board_id]) == counts["create"]
@@ -0,0 +1,197 @@
+"""
+Per-call tracing for the board scripts: latency histograms, a JSON run report and spans.
+
+MiroClient(trace=Trace()) records one entry per API call: method, endpoint (the path
+with IDs taken out), zone, status, retries, bytes sent and received, and where the
+time went: "network" (waiting on Miro), "waited" (queued on the rate limit) and
+"backoff" (sleeping between retries). From those, a Trace can
+
+- print latency histograms per zone and per endpoint (print_histograms),
+- build a run report with totals, percentiles and how busy the workers were, for saving
+  as JSON and diffing between runs (report), and
+- write the calls as OpenTelemetry spans in OTLP/JSON, one run span with a child per
+  zone and per call, for any viewer that reads OTLP files (write_spans).
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+
+# Histogram bucket upper bounds, in seconds (the last bucket is everything slower)
+BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BARS = " ▁▂▃▄▅▆▇█"
+# Label for calls that belong to no zone (board-wide listings, the board itself)
+NO_ZONE = "(board)"
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of sorted `values`."""
+    if not values:
+        return 0.0
+    return values[min(len(values), max(1, math.ceil(fraction * len(values)))) - 1]
+
+
+def _stats(calls):
+    latencies = sorted(c["latency"] for c in calls)
+    return {
+        "calls": len(calls),
+        "retries": sum(c["retries"] for c in calls),
+        "errors": sum(1 for c in calls if not c["status"] or c["status"] >= 400),
+        "p50": round(_percentile(latencies, 0.5), 4),
+        "p90": round(_percentile(latencies, 0.9), 4),
+        "p99": round(_percentile(latencies, 0.99), 4),
+        "max": round(latencies[-1], 4) if latencies else 0.0,
+        "network": round(sum(c["network"] for c in calls), 3),
+        "waited": round(sum(c["waited"] for c in calls), 3),
+        "backoff": round(sum(c["backoff"] for c in calls), 3),
+        "bytes_out": sum(c["bytes_out"] for c in calls),
+        "bytes_in": sum(c["bytes_in"] for c in calls),
+        "histogram": _histogram(latencies),
+    }
+
+
+def _histogram(latencies):
+    counts = [0] * (len(BUCKETS) + 1)
+    for latency in latencies:
+        counts[next((i for i, bound in enumerate(BUCKETS) if latency <= bound), len(BUCKETS))] += 1
+    return counts
+
+
+def _bar(counts):
+    top = max(counts) or 1
+    return "".join(BARS[0] if not n else BARS[max(1, round(n / top * (len(BARS) - 1)))] for n in counts)
+
+
+def _span_id(bits=64):
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _attributes(values):
+    out = []
+    for key, value in values.items():
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            out.append({"key": key, "value": {"stringValue": str(value)}})
+        elif isinstance(value, int):
+            out.append({"key": key, "value": {"intValue": str(value)}})
+        else:
+            out.append({"key": key, "value": {"doubleValue": value}})
+    return out
+
+
+class Trace:
+    """Thread-safe record of API calls for one run of a command."""
+
+    def __init__(self, command=""):
+        self.command = command
+        self.started = time.time()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def record(self, call):
+        call["zone"] = call.get("zone") or NO_ZONE
+        with self.lock:
+            self.calls.append(call)
+
+    def report(self, **extra):
+        """Run summary as a dict of plain values, keyed so two runs' reports diff cleanly.
+
+        "busy" is the average number of calls in flight: near 1 means the run was
+        sequential, near the worker count means it kept every worker busy.
+        """
+        with self.lock:
+            calls = list(self.calls)
+        elapsed = time.time() - self.started
+        by_zone, by_endpoint, by_status = {}, {}, {}
+        for c in calls:
+            by_zone.setdefault(c["zone"], []).append(c)
+            by_endpoint.setdefault(f"{c['method']} {c['endpoint']}", []).append(c)
+            by_status[str(c["status"] or "error")] = by_status.get(str(c["status"] or "error"), 0) + 1
+        zones = {}
+        for zone, zone_calls in by_zone.items():
+            zones[zone] = dict(_stats(zone_calls), wall=round(
+                max(c["start"] + c["latency"] for c in zone_calls) - min(c["start"] for c in zone_calls), 3))
+        return dict(extra, **{
+            "command": self.command,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started)),
+            "elapsed": round(elapsed, 3),
+            "busy": round(sum(c["latency"] for c in calls) / elapsed, 2) if elapsed else 0.0,
+            "buckets": [f"<={bound}s" for bound in BUCKETS] + [f">{BUCKETS[-1]}s"],
+            "total": _stats(calls),
+            "status": dict(sorted(by_status.items())),
+            "zones": dict(sorted(zones.items())),
+            "endpoints": {key: _stats(group) for key, group in sorted(by_endpoint.items())},
+        })
+
+    def print_histograms(self, report=None, file=None):
+        """Print per-zone and per-endpoint latency tables from `report` (or a fresh one)."""
+        report = report or self.report()
+        total = report["total"]
+        print("", file=file)
+        print(f"{total['calls']} calls in {report['elapsed']:.1f}s, {report['busy']:.1f} in flight on average; "
+              f"call time: {total['network']:.1f}s network, {total['waited']:.1f}s rate-limit wait, "
+              f"{total['backoff']:.1f}s retry backoff", file=file)
+        buckets = " ".join(b.replace("<=", "").replace(">", "+") for b in report["buckets"])
+        for title, rows in (("zone", report["zones"]), ("endpoint", report["endpoints"])):
+            width = max([len(title)] + [len(name) for name in rows])
+            print(f"  {title:<{width}} {'calls':>6} {'retries':>7} {'p50 ms':>7} {'p90 ms':>7} {'max ms':>7}  histogram ({buckets})", file=file)
+            for name, s in rows.items():
+                print(f"  {name:<{width}} {s['calls']:>6} {s['retries']:>7} {s['p50'] * 1000:>7.0f} {s['p90'] * 1000:>7.0f} "
+                      f"{s['max'] * 1000:>7.0f}  {_bar(s['histogram'])}", file=file)
+
+    def write_report(self, path, report=None, **extra):
+        report = report or self.report(**extra)
+        with open(path + ".part", "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        os.replace(path + ".part", path)
+        return report
+
+    def write_spans(self, path, service="build-miro-board"):
+        """Append the run to `path` as one OTLP/JSON ExportTraceServiceRequest line.
+
+        One span for the run, one per zone (first call start to last call end) and one per
+        API call under its zone, with the call's details as attributes.
+        """
+        with self.lock:
+            calls = list(self.calls)
+        trace_id = _span_id(128)
+        ns = lambda seconds: str(int(seconds * 1e9))
+        end = max([c["start"] + c["latency"] for c in calls] + [time.time()])
+        root = _span_id()
+        spans = [{"traceId": trace_id, "spanId": root, "name": self.command or service, "kind": 1,
+                  "startTimeUnixNano": ns(self.started), "endTimeUnixNano": ns(end), "attributes": []}]
+        zone_spans = {}
+        for zone in sorted({c["zone"] for c in calls}):
+            zone_calls = [c for c in calls if c["zone"] == zone]
+            zone_spans[zone] = _span_id()
+            spans.append({
+                "traceId": trace_id, "spanId": zone_spans[zone], "parentSpanId": root, "name": f"zone {zone}", "kind": 1,
+                "startTimeUnixNano": ns(min(c["start"] for c in zone_calls)),
+                "endTimeUnixNano": ns(max(c["start"] + c["latency"] for c in zone_calls)),
+                "attributes": _attributes({"miro.zone": zone, "miro.calls": len(zone_calls)}),
+            })
+        for c in calls:
+            failed = not c["status"] or c["status"] >= 400
+            spans.append({
+                "traceId": trace_id, "spanId": _span_id(), "parentSpanId": zone_spans[c["zone"]],
+                "name": f"{c['method']} {c['endpoint']}", "kind": 3,
+                "startTimeUnixNano": ns(c["start"]), "endTimeUnixNano": ns(c["start"] + c["latency"]),
+                "attributes": _attributes({
+                    "http.request.method": c["method"], "url.path": c["endpoint"], "http.response.status_code": c["status"],
+                    "miro.zone": c["zone"], "miro.retries": c["retries"], "miro.network_s": round(c["network"], 6),
+                    "miro.rate_limit_wait_s": round(c["waited"], 6), "miro.backoff_s": round(c["backoff"], 6),
+                    "http.request.body.size": c["bytes_out"], "http.response.body.size": c["bytes_in"],
+                }),
+                "status": {"code": 2 if failed else 1},
+            })
+        payload = {"resourceSpans": [{
+            "resource": {"attributes": _attributes({"service.name": service})},
+            "scopeSpans": [{"scope": {"name": service}, "spans": spans}],
+        }]}
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload) + "\n")
+        return len(spans)
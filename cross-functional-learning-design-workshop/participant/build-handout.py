@@ -5,26 +5,29 @@ Design system: minimalist utilitarian — monochrome, strict type scale, rule li
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
-from reportlab.lib.colors import HexColor, black, white
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    SimpleDocTemplate, Paragraph, Spacer, Table,
     HRFlowable, KeepTogether, PageBreak
 )
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+import argparse
 import os
 
+from theme import HANDOUT, registry, role_color
+
 # ─── Design tokens ────────────────────────────────────────────────────────────
+# Values live in theme.py, which also builds the paragraph and table styles, once
+
+THEME = HANDOUT
 
-INK       = HexColor("#111111")
-MID       = HexColor("#555555")
-LIGHT     = HexColor("#999999")
-RULE      = HexColor("#CCCCCC")
-FIELD_BG  = HexColor("#F7F7F7")
-WHITE     = white
+INK       = THEME.ink
+MID       = THEME.mid
+LIGHT     = THEME.light
+RULE      = THEME.rule
+FIELD_BG  = THEME.field_bg
+WHITE     = THEME.white
 
 PAGE_W, PAGE_H = A4
 MARGIN_LEFT   = 20 * mm
@@ -34,153 +37,24 @@ MARGIN_BOTTOM = 18 * mm
 
 BODY_W = PAGE_W - MARGIN_LEFT - MARGIN_RIGHT
 
+# Where --roster writes the personalised workbooks by default
+WORKBOOKS_DIR = "participant-workbooks"
+# Band in the participant's role colour across the top of a personalised cover
+ROLE_BAND = 4 * mm
+
 # Type scale (pt)
-T_DISPLAY  = 20
-T_TITLE    = 13
-T_LABEL    = 9
-T_BODY     = 9.5
-T_SMALL    = 8
-T_MICRO    = 7.5
-
-LEADING_DISPLAY = 24
-LEADING_TITLE   = 17
-LEADING_BODY    = 14
-LEADING_SMALL   = 12
-LEADING_MICRO   = 11
-
-# ─── Styles ───────────────────────────────────────────────────────────────────
-
-def make_styles():
-    s = {}
-
-    s["display"] = ParagraphStyle(
-        "display",
-        fontName="Helvetica-Bold",
-        fontSize=T_DISPLAY,
-        leading=LEADING_DISPLAY,
-        textColor=INK,
-        spaceAfter=2 * mm,
-    )
-    s["subtitle"] = ParagraphStyle(
-        "subtitle",
-        fontName="Helvetica",
-        fontSize=T_LABEL,
-        leading=LEADING_SMALL,
-        textColor=MID,
-        spaceAfter=6 * mm,
-    )
-    s["section_label"] = ParagraphStyle(
-        "section_label",
-        fontName="Helvetica-Bold",
-        fontSize=T_LABEL,
-        leading=LEADING_SMALL,
-        textColor=MID,
-        spaceBefore=5 * mm,
-        spaceAfter=1 * mm,
-        textTransform="uppercase",
-        letterSpacing=0.8,
-    )
-    s["phase_heading"] = ParagraphStyle(
-        "phase_heading",
-        fontName="Helvetica-Bold",
-        fontSize=T_TITLE,
-        leading=LEADING_TITLE,
-        textColor=INK,
-        spaceBefore=4 * mm,
-        spaceAfter=2 * mm,
-    )
-    s["sub_heading"] = ParagraphStyle(
-        "sub_heading",
-        fontName="Helvetica-Bold",
-        fontSize=T_BODY,
-        leading=LEADING_BODY,
-        textColor=INK,
-        spaceBefore=3 * mm,
-        spaceAfter=1 * mm,
-    )
-    s["prompt_label"] = ParagraphStyle(
-        "prompt_label",
-        fontName="Helvetica-Bold",
-        fontSize=T_SMALL,
-        leading=LEADING_SMALL,
-        textColor=INK,
-        spaceBefore=3 * mm,
-        spaceAfter=1.5 * mm,
-    )
-    s["body"] = ParagraphStyle(
-        "body",
-        fontName="Helvetica",
-        fontSize=T_BODY,
-        leading=LEADING_BODY,
-        textColor=INK,
-        spaceAfter=2 * mm,
-    )
-    s["body_note"] = ParagraphStyle(
-        "body_note",
-        fontName="Helvetica-Oblique",
-        fontSize=T_SMALL,
-        leading=LEADING_SMALL,
-        textColor=MID,
-        spaceAfter=2 * mm,
-    )
-    s["small"] = ParagraphStyle(
-        "small",
-        fontName="Helvetica",
-        fontSize=T_SMALL,
-        leading=LEADING_SMALL,
-        textColor=MID,
-        spaceAfter=1.5 * mm,
-    )
-    s["micro"] = ParagraphStyle(
-        "micro",
-        fontName="Helvetica",
-        fontSize=T_MICRO,
-        leading=LEADING_MICRO,
-        textColor=LIGHT,
-    )
-    s["table_header"] = ParagraphStyle(
-        "table_header",
-        fontName="Helvetica-Bold",
-        fontSize=T_SMALL,
-        leading=LEADING_SMALL,
-        textColor=INK,
-    )
-    s["table_cell"] = ParagraphStyle(
-        "table_cell",
-        fontName="Helvetica",
-        fontSize=T_SMALL,
-        leading=LEADING_SMALL,
-        textColor=INK,
-    )
-    s["quote"] = ParagraphStyle(
-        "quote",
-        fontName="Helvetica-BoldOblique",
-        fontSize=T_BODY,
-        leading=LEADING_BODY,
-        textColor=INK,
-        leftIndent=5 * mm,
-        spaceBefore=2 * mm,
-        spaceAfter=2 * mm,
-    )
-    s["reference_heading"] = ParagraphStyle(
-        "reference_heading",
-        fontName="Helvetica-Bold",
-        fontSize=T_BODY,
-        leading=LEADING_BODY,
-        textColor=INK,
-        spaceBefore=4 * mm,
-        spaceAfter=1 * mm,
-    )
-    s["footer"] = ParagraphStyle(
-        "footer",
-        fontName="Helvetica",
-        fontSize=T_MICRO,
-        leading=LEADING_MICRO,
-        textColor=LIGHT,
-        alignment=TA_CENTER,
-    )
+T_DISPLAY  = THEME.t_display
+T_TITLE    = THEME.t_title
+T_LABEL    = THEME.t_label
+T_BODY     = THEME.t_body
+T_SMALL    = THEME.t_small
+T_MICRO    = THEME.t_micro
 
-    return s
+LEADING_DISPLAY = THEME.leading_display
+LEADING_TITLE   = THEME.leading_title
+LEADING_BODY    = THEME.leading_body
+LEADING_SMALL   = THEME.leading_small
+LEADING_MICRO   = THEME.leading_micro
 
 
 # ─── Reusable components ──────────────────────────────────────────────────────
@@ -202,59 +76,25 @@ def write_lines(n=3, width=None):
     for _ in range(n):
         rows.append([""])
     t = Table(rows, colWidths=[w])
-    t.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, -1), FIELD_BG),
-        ("LINEBELOW",     (0, 0), (-1, -1), 0.5, RULE),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 3),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 3),
-        ("TOPPADDING",    (0, 0), (-1, -1), 7),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
-    ]))
+    t.setStyle(registry(THEME).tables["write_lines"])
     return t
 
-def inline_field(label, width=None):
-    """Single-line labelled field."""
+def inline_field(label, width=None, value=""):
+    """Single-line labelled field, blank or filled in with `value`."""
     w = width or BODY_W
-    t = Table([[label, ""]], colWidths=[w * 0.35, w * 0.65])
-    t.setStyle(TableStyle([
-        ("FONTNAME",      (0, 0), (0, 0), "Helvetica-Bold"),
-        ("FONTNAME",      (1, 0), (1, 0), "Helvetica"),
-        ("FONTSIZE",      (0, 0), (-1, -1), T_SMALL),
-        ("LEADING",       (0, 0), (-1, -1), LEADING_SMALL),
-        ("TEXTCOLOR",     (0, 0), (0, 0), INK),
-        ("TEXTCOLOR",     (1, 0), (1, 0), MID),
-        ("LINEBELOW",     (1, 0), (1, 0), 0.5, INK),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
-        ("TOPPADDING",    (0, 0), (-1, -1), 2),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ("VALIGN",        (0, 0), (-1, -1), "BOTTOM"),
-    ]))
+    t = Table([[label, value]], colWidths=[w * 0.35, w * 0.65])
+    t.setStyle(registry(THEME).tables["inline_field"])
     return t
 
 def grid_table(headers, row_count, col_widths=None):
     """Structured table with headers and empty data rows for writing."""
     col_widths = col_widths or [BODY_W / len(headers)] * len(headers)
-    header_row = [Paragraph(h, make_styles()["table_header"]) for h in headers]
+    styles = registry(THEME)
+    header_row = [Paragraph(h, styles.paragraphs["table_header"]) for h in headers]
     data_rows = [[""] * len(headers) for _ in range(row_count)]
     data = [header_row] + data_rows
     t = Table(data, colWidths=col_widths)
-    t.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, 0), INK),
-        ("TEXTCOLOR",     (0, 0), (-1, 0), WHITE),
-        ("BACKGROUND",    (0, 1), (-1, -1), FIELD_BG),
-        ("GRID",          (0, 0), (-1, -1), 0.4, RULE),
-        ("LINEBELOW",     (0, 1), (-1, -1), 0.5, RULE),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 4),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
-        ("TOPPADDING",    (0, 0), (-1, 0), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, 0), 4),
-        ("TOPPADDING",    (0, 1), (-1, -1), 10),
-        ("BOTTOMPADDING", (0, 1), (-1, -1), 2),
-        ("FONTNAME",      (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE",      (0, 0), (-1, -1), T_SMALL),
-        ("LEADING",       (0, 0), (-1, -1), LEADING_SMALL),
-    ]))
+    t.setStyle(styles.tables["grid"])
     return t
 
 def section_divider(styles):
@@ -302,9 +142,17 @@ class WorkbookTemplate(SimpleDocTemplate):
 
 # ─── Content builders ─────────────────────────────────────────────────────────
 
-def build_cover(styles):
+def build_cover(styles, participant=None):
+    """The cover page. `participant`, a roster row (see workbooks.py), fills in the
+    identity fields and adds a Team field and a band in the role's colour."""
+    p = participant or {}
     elems = []
-    elems.append(Spacer(1, 20 * mm))
+    color = role_color(p.get("role", ""), p.get("colour", "")) if p else None
+    if color:
+        # In place of the spacer, at the same height, so the cover keeps to one page
+        elems.append(rule(thickness=ROLE_BAND, color=color, space_before=0, space_after=20 * mm - ROLE_BAND))
+    else:
+        elems.append(Spacer(1, 20 * mm))
     elems.append(Paragraph("Participant Workbook", styles["display"]))
     elems.append(Paragraph(
         "Designing Learning as a Cross-Functional Activity System",
@@ -313,8 +161,8 @@ def build_cover(styles):
     elems.append(rule(thickness=1.5, color=INK, space_before=2*mm, space_after=8*mm))
 
     # Identity fields
-    for label in ["Name", "Role", "Date"]:
-        elems.append(inline_field(f"{label}:"))
+    for label in ["Name", "Role", "Team", "Date"] if p.get("team") else ["Name", "Role", "Date"]:
+        elems.append(inline_field(f"{label}:", value=p.get(label.lower(), "")))
         elems.append(Spacer(1, 3 * mm))
 
     elems.append(Spacer(1, 10 * mm))
@@ -368,18 +216,7 @@ def build_cover(styles):
     ]
     col_w = [BODY_W * 0.28, BODY_W * 0.72]
     t = Table(glossary_data, colWidths=col_w)
-    t.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, 0), INK),
-        ("TEXTCOLOR",     (0, 0), (-1, 0), WHITE),
-        ("BACKGROUND",    (0, 1), (-1, -1), FIELD_BG),
-        ("ROWBACKGROUNDS",(0, 1), (-1, -1), [WHITE, FIELD_BG]),
-        ("GRID",          (0, 0), (-1, -1), 0.4, RULE),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 5),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 5),
-        ("TOPPADDING",    (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
-    ]))
+    t.setStyle(registry(THEME).tables["glossary"])
     elems.append(t)
 
     return elems
@@ -913,17 +750,7 @@ def build_reference(styles):
 
     col_w = [BODY_W * 0.22, BODY_W * 0.30, BODY_W * 0.48]
     t = Table(role_data, colWidths=col_w)
-    t.setStyle(TableStyle([
-        ("BACKGROUND",    (0, 0), (-1, 0), INK),
-        ("TEXTCOLOR",     (0, 0), (-1, 0), WHITE),
-        ("ROWBACKGROUNDS",(0, 1), (-1, -1), [WHITE, FIELD_BG]),
-        ("GRID",          (0, 0), (-1, -1), 0.4, RULE),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 5),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 5),
-        ("TOPPADDING",    (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
-    ]))
+    t.setStyle(registry(THEME).tables["roles"])
     elems.append(t)
 
     elems.append(Spacer(1, 10 * mm))
@@ -939,21 +766,9 @@ def build_reference(styles):
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def build_pdf(output_path):
-    styles = make_styles()
-
-    doc = WorkbookTemplate(
-        output_path,
-        pagesize=A4,
-        leftMargin=MARGIN_LEFT,
-        rightMargin=MARGIN_RIGHT,
-        topMargin=MARGIN_TOP,
-        bottomMargin=MARGIN_BOTTOM,
-    )
-
+def build_body(styles):
+    """Everything after the cover: the same in every workbook."""
     story = []
-    story += build_cover(styles)
-    story.append(PageBreak())
     story += build_phase1(styles)
     story.append(PageBreak())
     story += build_phase2(styles)
@@ -968,11 +783,51 @@ def build_pdf(output_path):
     story.append(PageBreak())
     story += build_phase7(styles)
     story += build_reference(styles)
+    return story
+
+
+def build_story(styles, participant=None):
+    return build_cover(styles, participant) + [PageBreak()] + build_body(styles)
 
-    doc.build(story)
+
+def make_doc(output):
+    """The workbook's page template, writing to `output` (a path or a file object)."""
+    return WorkbookTemplate(
+        output,
+        pagesize=A4,
+        leftMargin=MARGIN_LEFT,
+        rightMargin=MARGIN_RIGHT,
+        topMargin=MARGIN_TOP,
+        bottomMargin=MARGIN_BOTTOM,
+    )
+
+
+def build_pdf(output_path):
+    doc = make_doc(output_path)
+    doc.build(build_story(registry(THEME).paragraphs))
     print(f"PDF written to: {output_path}")
 
 
 if __name__ == "__main__":
-    out = os.path.join(os.path.dirname(__file__), "learner-handout.pdf")
-    build_pdf(out)
+    parser = argparse.ArgumentParser(description="Build learner-handout.pdf, or one workbook per participant in a roster.")
+    parser.add_argument("--roster", metavar="CSV", help="roster with a name column and optional role, team, date and "
+                                                        "colour columns; writes a personalised workbook per row")
+    parser.add_argument("-o", "--output", help=f"output file (default: learner-handout.pdf), or with --roster a directory "
+                                                f"or .zip file (default: {WORKBOOKS_DIR}/)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes to build workbooks in "
+                                                                             "(default: one per CPU)")
+    args = parser.parse_args()
+    here = os.path.dirname(os.path.abspath(__file__))
+    if args.roster:
+        from workbooks import build_workbooks, read_roster  # only for --roster; needs slides/pagesplice.py
+
+        try:
+            participants = read_roster(args.roster)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        if not participants:
+            parser.error(f"no participants in {args.roster}; it needs a \"name\" column")
+        build_workbooks(os.path.abspath(__file__), participants, args.output or os.path.join(here, WORKBOOKS_DIR),
+                        args.workers)
+    else:
+        build_pdf(args.output or os.path.join(here, "learner-handout.pdf"))
@@ -0,0 +1,61 @@
+"""
+Role colours on the workbook covers match the sticky note colours of the workshop boards.
+
+Run from this folder: python -m pytest -q
+"""
+
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+from theme import ROLES, role_color
+
+FACILITATOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "facilitator")
+
+
+@pytest.fixture(scope="module")
+def board():
+    """build-miro-board.py's role colours (Miro colour names), the hex of each Miro colour
+    and board-spec.json's role names."""
+    sys.path.insert(0, FACILITATOR)
+    try:
+        spec = importlib.util.spec_from_file_location("build_miro_board", os.path.join(FACILITATOR, "build-miro-board.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        import preview
+    finally:
+        sys.path.remove(FACILITATOR)
+    with open(module.SPEC_PATH, encoding="utf-8") as f:
+        names = json.load(f)["roles"]
+    return module.ROLE_COLORS, preview.STICKY_COLORS, names
+
+
+@pytest.mark.parametrize("role, key", [
+    ("Curriculum Design", "curriculum"),
+    ("Curriculum Designer", "curriculum"),
+    ("Learning / Experience Design", "learning_design"),
+    ("Learning or Experience Design", "learning_design"),
+    ("Multimedia Design", "multimedia"),
+    ("Learning Technology", "learning_tech"),
+    ("Learning Technologist", "learning_tech"),
+    ("  learning   technologist ", "learning_tech"),
+    ("learning_tech", "learning_tech"),
+])
+def test_role_color_matches_board(board, role, key):
+    colors, sticky, _ = board
+    assert role_color(role).hexval() == "0x" + sticky[colors[key]].lstrip("#").lower()
+
+
+def test_every_board_role_has_its_board_name(board):
+    colors, _, names = board
+    assert set(ROLES) == set(colors) == set(names)
+    for key, name in names.items():
+        assert role_color(name) is ROLES[key][0]
+
+
+def test_unknown_role_and_explicit_colour():
+    assert role_color("Learning Scientist") is None
+    assert role_color("Learning Technologist", "#123456").hexval() == "0x123456"
@@ -0,0 +1,294 @@
+"""
+Design tokens for the learner handout and the reportlab styles built from them.
+
+A Theme holds the tokens: colours, fonts, the type scale and its leadings. registry()
+compiles a theme into a Styles registry, the ParagraphStyles by name and the
+TableStyles of the handout's tables. The registry is built once per theme per process
+and read-only: look styles up, and derive a variant (ParagraphStyle(name, parent=...),
+or theme._replace(...) for another theme) rather than change a shared one. So a
+process that renders many handouts builds each style once.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from reportlab.lib.colors import HexColor, white
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import TableStyle
+
+Theme = namedtuple("Theme", [
+    "ink", "mid", "light", "rule", "field_bg", "white",
+    "font", "font_bold", "font_italic", "font_bold_italic",
+    "t_display", "t_title", "t_label", "t_body", "t_small", "t_micro",
+    "leading_display", "leading_title", "leading_body", "leading_small", "leading_micro",
+])
+
+HANDOUT = Theme(
+    ink=HexColor("#111111"),
+    mid=HexColor("#555555"),
+    light=HexColor("#999999"),
+    rule=HexColor("#CCCCCC"),
+    field_bg=HexColor("#F7F7F7"),
+    white=white,
+    font="Helvetica",
+    font_bold="Helvetica-Bold",
+    font_italic="Helvetica-Oblique",
+    font_bold_italic="Helvetica-BoldOblique",
+    # Type scale (pt)
+    t_display=20,
+    t_title=13,
+    t_label=9,
+    t_body=9.5,
+    t_small=8,
+    t_micro=7.5,
+    leading_display=24,
+    leading_title=17,
+    leading_body=14,
+    leading_small=12,
+    leading_micro=11,
+)
+
+Styles = namedtuple("Styles", "paragraphs tables")
+
+# The four roles of the workshop boards, by their role key in facilitator/board-spec.json:
+# the Miro sticky note colour the board gives them (build-miro-board.py's COLOR_*
+# constants, as hex) and the names a roster may give the role, matched whole and
+# regardless of case: the key, the role's name on the boards and in this handout, and
+# the practitioner's title
+ROLES = {
+    "curriculum": (HexColor("#FFF9B1"), (  # light_yellow
+        "Curriculum Design", "Curriculum Designer")),
+    "learning_design": (HexColor("#A6CCF5"), (  # light_blue
+        "Learning / Experience Design", "Learning or Experience Design", "Learning Design",
+        "Experience Design", "Learning Experience Design", "Learning Designer",
+        "Learning Experience Designer", "Experience Designer")),
+    "multimedia": (HexColor("#D5F692"), (  # light_green
+        "Multimedia Design", "Multimedia Designer")),
+    "learning_tech": (HexColor("#FF9D48"), (  # orange
+        "Learning Technology", "Learning Technologist")),
+}
+ROLE_NAMES = {" ".join(name.lower().split()): key for key, (_, names) in ROLES.items() for name in (key, *names)}
+
+
+def role_color(role, colour=""):
+    """Colour for a participant: `colour` (hex, e.g. "#A6CCF5") if given, else the colour of
+    `role` if it is one of the names in ROLES, else None."""
+    if colour:
+        return HexColor(colour)
+    key = ROLE_NAMES.get(" ".join(role.lower().split()))
+    return ROLES[key][0] if key else None
+
+
+def _paragraph_styles(t):
+    s = {}
+
+    s["display"] = ParagraphStyle(
+        "display",
+        fontName=t.font_bold,
+        fontSize=t.t_display,
+        leading=t.leading_display,
+        textColor=t.ink,
+        spaceAfter=2 * mm,
+    )
+    s["subtitle"] = ParagraphStyle(
+        "subtitle",
+        fontName=t.font,
+        fontSize=t.t_label,
+        leading=t.leading_small,
+        textColor=t.mid,
+        spaceAfter=6 * mm,
+    )
+    s["section_label"] = ParagraphStyle(
+        "section_label",
+        fontName=t.font_bold,
+        fontSize=t.t_label,
+        leading=t.leading_small,
+        textColor=t.mid,
+        spaceBefore=5 * mm,
+        spaceAfter=1 * mm,
+        textTransform="uppercase",
+        letterSpacing=0.8,
+    )
+    s["phase_heading"] = ParagraphStyle(
+        "phase_heading",
+        fontName=t.font_bold,
+        fontSize=t.t_title,
+        leading=t.leading_title,
+        textColor=t.ink,
+        spaceBefore=4 * mm,
+        spaceAfter=2 * mm,
+    )
+    s["sub_heading"] = ParagraphStyle(
+        "sub_heading",
+        fontName=t.font_bold,
+        fontSize=t.t_body,
+        leading=t.leading_body,
+        textColor=t.ink,
+        spaceBefore=3 * mm,
+        spaceAfter=1 * mm,
+    )
+    s["prompt_label"] = ParagraphStyle(
+        "prompt_label",
+        fontName=t.font_bold,
+        fontSize=t.t_small,
+        leading=t.leading_small,
+        textColor=t.ink,
+        spaceBefore=3 * mm,
+        spaceAfter=1.5 * mm,
+    )
+    s["body"] = ParagraphStyle(
+        "body",
+        fontName=t.font,
+        fontSize=t.t_body,
+        leading=t.leading_body,
+        textColor=t.ink,
+        spaceAfter=2 * mm,
+    )
+    s["body_note"] = ParagraphStyle(
+        "body_note",
+        fontName=t.font_italic,
+        fontSize=t.t_small,
+        leading=t.leading_small,
+        textColor=t.mid,
+        spaceAfter=2 * mm,
+    )
+    s["small"] = ParagraphStyle(
+        "small",
+        fontName=t.font,
+        fontSize=t.t_small,
+        leading=t.leading_small,
+        textColor=t.mid,
+        spaceAfter=1.5 * mm,
+    )
+    s["micro"] = ParagraphStyle(
+        "micro",
+        fontName=t.font,
+        fontSize=t.t_micro,
+        leading=t.leading_micro,
+        textColor=t.light,
+    )
+    s["table_header"] = ParagraphStyle(
+        "table_header",
+        fontName=t.font_bold,
+        fontSize=t.t_small,
+        leading=t.leading_small,
+        textColor=t.ink,
+    )
+    s["table_cell"] = ParagraphStyle(
+        "table_cell",
+        fontName=t.font,
+        fontSize=t.t_small,
+        leading=t.leading_small,
+        textColor=t.ink,
+    )
+    s["quote"] = ParagraphStyle(
+        "quote",
+        fontName=t.font_bold_italic,
+        fontSize=t.t_body,
+        leading=t.leading_body,
+        textColor=t.ink,
+        leftIndent=5 * mm,
+        spaceBefore=2 * mm,
+        spaceAfter=2 * mm,
+    )
+    s["reference_heading"] = ParagraphStyle(
+        "reference_heading",
+        fontName=t.font_bold,
+        fontSize=t.t_body,
+        leading=t.leading_body,
+        textColor=t.ink,
+        spaceBefore=4 * mm,
+        spaceAfter=1 * mm,
+    )
+    s["footer"] = ParagraphStyle(
+        "footer",
+        fontName=t.font,
+        fontSize=t.t_micro,
+        leading=t.leading_micro,
+        textColor=t.light,
+        alignment=TA_CENTER,
+    )
+
+    return s
+
+
+def _table_styles(t):
+    s = {}
+
+    # Blank write-in lines
+    s["write_lines"] = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, -1), t.field_bg),
+        ("LINEBELOW",     (0, 0), (-1, -1), 0.5, t.rule),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 3),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 3),
+        ("TOPPADDING",    (0, 0), (-1, -1), 7),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+    ])
+    # Label and a ruled answer on one line
+    s["inline_field"] = TableStyle([
+        ("FONTNAME",      (0, 0), (0, 0), t.font_bold),
+        ("FONTNAME",      (1, 0), (1, 0), t.font),
+        ("FONTSIZE",      (0, 0), (-1, -1), t.t_small),
+        ("LEADING",       (0, 0), (-1, -1), t.leading_small),
+        ("TEXTCOLOR",     (0, 0), (0, 0), t.ink),
+        ("TEXTCOLOR",     (1, 0), (1, 0), t.mid),
+        ("LINEBELOW",     (1, 0), (1, 0), 0.5, t.ink),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 0),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
+        ("TOPPADDING",    (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ("VALIGN",        (0, 0), (-1, -1), "BOTTOM"),
+    ])
+    # Header row over empty rows to write in
+    s["grid"] = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, 0), t.ink),
+        ("TEXTCOLOR",     (0, 0), (-1, 0), t.white),
+        ("BACKGROUND",    (0, 1), (-1, -1), t.field_bg),
+        ("GRID",          (0, 0), (-1, -1), 0.4, t.rule),
+        ("LINEBELOW",     (0, 1), (-1, -1), 0.5, t.rule),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 4),
+        ("TOPPADDING",    (0, 0), (-1, 0), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 4),
+        ("TOPPADDING",    (0, 1), (-1, -1), 10),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 2),
+        ("FONTNAME",      (0, 0), (-1, 0), t.font_bold),
+        ("FONTSIZE",      (0, 0), (-1, -1), t.t_small),
+        ("LEADING",       (0, 0), (-1, -1), t.leading_small),
+    ])
+    # Header row over filled-in rows, striped: the glossary, then the roles table
+    s["glossary"] = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, 0), t.ink),
+        ("TEXTCOLOR",     (0, 0), (-1, 0), t.white),
+        ("BACKGROUND",    (0, 1), (-1, -1), t.field_bg),
+        ("ROWBACKGROUNDS",(0, 1), (-1, -1), [t.white, t.field_bg]),
+        ("GRID",          (0, 0), (-1, -1), 0.4, t.rule),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 5),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 5),
+        ("TOPPADDING",    (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
+    ])
+    s["roles"] = TableStyle([
+        ("BACKGROUND",    (0, 0), (-1, 0), t.ink),
+        ("TEXTCOLOR",     (0, 0), (-1, 0), t.white),
+        ("ROWBACKGROUNDS",(0, 1), (-1, -1), [t.white, t.field_bg]),
+        ("GRID",          (0, 0), (-1, -1), 0.4, t.rule),
+        ("LEFTPADDING",   (0, 0), (-1, -1), 5),
+        ("RIGHTPADDING",  (0, 0), (-1, -1), 5),
+        ("TOPPADDING",    (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("VALIGN",        (0, 0), (-1, -1), "TOP"),
+    ])
+
+    return s
+
+
+@lru_cache(maxsize=None)
+def registry(theme=HANDOUT):
+    """The Styles registry for `theme`, built on the first call and shared after."""
+    return Styles(paragraphs=MappingProxyType(_paragraph_styles(theme)),
+                  tables=MappingProxyType(_table_styles(theme)))
@@ -0,0 +1,137 @@
+"""
+Personalised participant workbooks, one per row of a roster CSV.
+
+The roster needs a "name" column; "role", "team", "date" and "colour" are optional.
+Each workbook's cover is filled in from its row, with a band in the role's colour
+(theme.role_color: the "colour" column as hex, else the colour of the role on the
+workshop boards, for a role named as in theme.ROLES; no band for any other role).
+
+Only the cover differs between workbooks, so everything after it is laid out once per
+process: the generic workbook is built on a canvas that keeps each page's operators,
+and each participant's workbook is their cover followed by those pages, with their font
+references renamed to the new document's (slides/pagesplice.py, which splices slides). A
+cover that runs to more pages than the generic one would shift the page numbers, so
+that workbook is built in full instead.
+
+Workbooks are built in a process pool and written as they arrive, in roster order, to
+a directory of PDFs or, for an output path ending in .zip, into one ZIP file. At most
+IN_FLIGHT workbooks per worker are submitted ahead of the one being written, so memory
+stays bounded however long the roster.
+"""
+
+import csv
+import importlib.util
+import io
+import os
+import re
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Page recording and splicing, shared with the slide builders. Loaded from its file, as
+# build-handout.py is below, so the slides folder never goes on sys.path
+PAGESPLICE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "slides", "pagesplice.py")
+_spec = importlib.util.spec_from_file_location("_pagesplice", PAGESPLICE)
+pagesplice = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pagesplice)
+
+HEX_COLOUR = re.compile(r"#?([0-9A-Fa-f]{6})")
+# Workbooks submitted to the pool per worker ahead of the one being written
+IN_FLIGHT = 2
+
+
+def read_roster(path):
+    """Participants from a roster CSV, in order, each with "file" set to a unique PDF name."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = [{k.strip().lower(): (v or "").strip() for k, v in row.items() if k} for row in csv.DictReader(f)]
+    rows = [row for row in rows if row.get("name")]
+    for n, row in enumerate(rows, 1):
+        if row.get("colour"):
+            match = HEX_COLOUR.fullmatch(row["colour"])
+            if not match:
+                raise ValueError(f"{path}: {row['name']}: colour must be a hex value like #A6CCF5, not {row['colour']!r}")
+            row["colour"] = "#" + match.group(1)
+        slug = re.sub(r"[^a-z0-9]+", "-", row["name"].lower()).strip("-") or "participant"
+        row["file"] = f"{n:04d}-{slug}.pdf"
+    return rows
+
+
+_handouts = {}  # build-handout.py path -> (module, cover pages, pages after the cover), per process
+
+
+def _handout(script):
+    state = _handouts.get(script)
+    if state is None:
+        spec = importlib.util.spec_from_file_location("_handout", script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        styles = module.registry(module.THEME).paragraphs
+        doc = module.make_doc(io.BytesIO())
+        doc.build(module.build_cover(styles))
+        cover_pages = doc.page
+        doc = module.make_doc(io.BytesIO())
+        doc.build(module.build_story(styles), canvasmaker=pagesplice.RecordingCanvas)
+        body = doc.canv.pages[cover_pages:] if doc.canv.movable() else None
+        state = _handouts[script] = (module, cover_pages, body)
+    return state
+
+
+def render_workbook(script, participant):
+    """One participant's workbook as PDF bytes, and whether it was built in full."""
+    module, cover_pages, body = _handout(script)
+    styles = module.registry(module.THEME).paragraphs
+    if body is not None:
+        out = io.BytesIO()
+        doc = module.make_doc(out)
+        doc.build(module.build_cover(styles, participant), canvasmaker=partial(pagesplice.SplicingCanvas, pages=body))
+        if doc.page == cover_pages:
+            return out.getvalue(), False
+    out = io.BytesIO()
+    module.make_doc(out).build(module.build_story(styles, participant))
+    return out.getvalue(), True
+
+
+def _render_ahead(pool, script, participants, window):
+    """render_workbook for each participant, in order, with at most `window` submitted at once."""
+    pending = deque()
+    for participant in participants:
+        if len(pending) == window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(render_workbook, script, participant))
+    while pending:
+        yield pending.popleft().result()
+
+
+def build_workbooks(script, participants, output, workers=1):
+    """Write a workbook for each of `participants` (see read_roster) to `output`, a directory
+    or a .zip file. `script` is build-handout.py, loaded in each worker process."""
+    started = time.monotonic()
+    zipped = output.lower().endswith(".zip")
+    if zipped:
+        sink = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+    else:
+        os.makedirs(output, exist_ok=True)
+    full = 0
+    pool = None
+    try:
+        if workers <= 1 or len(participants) <= 1:
+            results = (render_workbook(script, p) for p in participants)
+        else:
+            workers = min(workers, len(participants))
+            pool = ProcessPoolExecutor(workers)
+            results = _render_ahead(pool, script, participants, workers * IN_FLIGHT)
+        for participant, (pdf, in_full) in zip(participants, results):
+            if zipped:
+                sink.writestr(participant["file"], pdf)
+            else:
+                with open(os.path.join(output, participant["file"]), "wb") as f:
+                    f.write(pdf)
+            full += in_full
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        if zipped:
+            sink.close()
+    print(f"{len(participants)} workbooks written to: {output} ({full} built in full, {time.monotonic() - started:.1f}s)")
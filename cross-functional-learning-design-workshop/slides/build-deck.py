@@ -0,0 +1,38 @@
+"""
+Builds workshop-slides.pdf and workshop-slides.pptx together from one reading of
+deck-spec.json.
+
+The spec is parsed and checked once, then the two builders run side by side in
+separate processes, so a full build takes about as long as the slower of the two.
+Run from slides folder: python build-deck.py
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from deck import load_deck, run_builder
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def build_deck(pdf_path, pptx_path, force=False, workers=1):
+    """Write both decks. `force` and `workers` are passed to the PDF builder (see build-slides.py)."""
+    deck = load_deck()
+    with ProcessPoolExecutor(2) as pool:
+        jobs = [
+            pool.submit(run_builder, os.path.join(HERE, "build-slides.py"), "build_slides", pdf_path, deck,
+                        force=force, workers=workers),
+            pool.submit(run_builder, os.path.join(HERE, "build-pptx.py"), "build_pptx", pptx_path, deck),
+        ]
+        for job in jobs:
+            job.result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build workshop-slides.pdf and workshop-slides.pptx.")
+    parser.add_argument("--force", action="store_true", help="redraw every PDF slide instead of reusing cached pages")
+    parser.add_argument("--workers", type=int, default=1, help="processes to draw PDF slides in (default: 1)")
+    args = parser.parse_args()
+    build_deck(os.path.join(HERE, "workshop-slides.pdf"), os.path.join(HERE, "workshop-slides.pptx"),
+               force=args.force, workers=args.workers)
@@ -0,0 +1,133 @@
+"""
+The workshop deck as data: what every slide says, shared by the PDF and PPTX builders.
+
+deck-spec.json lists the slides in order. Each has an "id", a "type" naming its layout
+and the content fields that layout uses:
+
+  label    small all-caps line above the title
+  title    slide heading
+  lines    text with fixed line breaks (quotes, the title block)
+  body     lead paragraph, or the text of a callout
+  bullets  list of items, numbered or marked as the layout decides
+  rows     list of tuples, e.g. [term, explanation] or [phase, time, title]
+  note     closing remark at the foot of the slide
+  image    label of an image slot, or null for none
+  asset    photo for the slot, a file name in assets/images/ (see images.py)
+
+plus a few layout-specific ones (phase, number, implication, aside, columns).
+load_deck checks each slide against LAYOUTS and fills in what both builders derive
+rather than hard-code: "n" (1-based position), "total" and "footer" (the current
+phase, from the last phase header before the slide, or the deck title).
+
+build-deck.py parses the spec once and hands it to both builders through run_builder.
+select picks out slides by number range or phase, for previews.
+"""
+
+import importlib.util
+import json
+import os
+
+DECK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "deck-spec.json")
+
+# Layout name -> fields a slide of that type must have
+LAYOUTS = {
+    "title": ("label", "lines", "body", "image"),
+    "agenda": ("label", "title", "rows"),
+    "quote": ("label", "title", "lines", "note"),
+    "phase": ("phase", "title", "body", "image"),
+    "callout": ("label", "title", "body", "note"),
+    "definition": ("label", "lines", "aside", "rows"),
+    "contrast": ("label", "title", "body", "columns"),
+    "prompts": ("label", "title", "bullets", "note"),
+    "recall": ("label", "title", "lines", "note"),
+    "reveal": ("label", "title", "bullets", "note"),
+    "commitment": ("number", "title", "body", "implication"),
+    "discussion": ("label", "title", "body", "bullets"),
+    "example": ("label", "title", "body", "rows", "note"),
+    "table": ("label", "title", "rows"),
+    "cards": ("label", "title", "body", "rows"),
+    "steps": ("label", "title", "rows"),
+    "transition": ("label", "title", "lines", "note"),
+    "checklist": ("label", "title", "body", "bullets"),
+    "hinted": ("label", "title", "body", "rows"),
+    "break": ("title", "body", "note"),
+    "grid": ("label", "title", "body", "bullets"),
+    "questions": ("label", "title", "body", "bullets"),
+    "stickies": ("label", "title", "body", "rows"),
+    "list": ("label", "title", "body", "bullets"),
+    "followup": ("label", "title", "body", "bullets", "note"),
+    "closing": ("label", "title", "bullets", "note"),
+    "close": ("label", "bullets", "image"),
+}
+
+
+def load_deck(path=DECK_PATH):
+    """Read and check the deck spec. Returns {"deck": {...}, "slides": [...]} with derived fields set."""
+    with open(path, encoding="utf-8") as f:
+        deck = json.load(f)
+    slides = deck["slides"]
+    seen = set()
+    footer = deck["deck"]["title"]
+    for n, slide in enumerate(slides, 1):
+        where = f"{path}: slide {n} ({slide.get('id', 'no id')})"
+        if not slide.get("id"):
+            raise ValueError(f"{where}: missing id")
+        if slide["id"] in seen:
+            raise ValueError(f"{where}: id used twice")
+        seen.add(slide["id"])
+        if slide.get("type") not in LAYOUTS:
+            raise ValueError(f"{where}: unknown slide type {slide.get('type')!r}")
+        missing = [field for field in LAYOUTS[slide["type"]] if field not in slide]
+        if missing:
+            raise ValueError(f"{where}: {slide['type']} slide needs {', '.join(missing)}")
+        slide.update(n=n, total=len(slides), footer=footer)
+        if slide["type"] == "phase":
+            # The header itself carries the deck title; the slides after it, the phase
+            slide["footer"] = deck["deck"]["title"]
+            footer = f"Phase {slide['phase']} — {slide['title']}"
+    return deck
+
+
+def parse_range(text):
+    """Slide numbers from e.g. "10-17" or "3,5,10-12", as a sorted list."""
+    numbers = set()
+    for part in text.split(","):
+        first, dash, last = part.strip().partition("-")
+        try:
+            first, last = int(first), int(last if dash else first)
+        except ValueError:
+            raise ValueError(f"not a slide range: {text!r}") from None
+        if last < first:
+            raise ValueError(f"not a slide range: {text!r}")
+        numbers.update(range(first, last + 1))
+    return sorted(numbers)
+
+
+def select(deck, numbers=None, phase=None):
+    """Slides of `deck` whose number is in `numbers` and that belong to `phase` (its header
+    and everything up to the next phase header). Either filter may be None for any."""
+    slides = []
+    current = None
+    for slide in deck["slides"]:
+        if slide["type"] == "phase":
+            current = slide["phase"]
+        if numbers is not None and slide["n"] not in numbers:
+            continue
+        if phase is not None and current != str(phase):
+            continue
+        slides.append(slide)
+    if not slides:
+        raise ValueError("no slides match the selection")
+    return slides
+
+
+def run_builder(script, builder, output_path, deck, **options):
+    """Load the build script at `script` and call its `builder(output_path, deck, **options)`.
+
+    A process pool task: the scripts' file names have hyphens, so they are loaded by path
+    in the worker rather than imported and pickled.
+    """
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(script))[0].replace("-", "_"), script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, builder)(output_path, deck, **options)
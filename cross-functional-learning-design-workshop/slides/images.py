@@ -0,0 +1,86 @@
+"""
+Prepares the photos for the slides' image slots.
+
+Each slot names an asset in assets/images/ (the "asset" field in deck-spec.json). The
+asset is desaturated (the deck is monochrome), cropped to the slot's shape, scaled to
+the slot's size at IMAGE_DPI and saved as a JPEG in the image cache. The file name
+hashes the source's bytes, the output size and the settings below, so an image is only
+reprocessed when it changes, and a deck that uses one image twice at one size gets one
+file, which the PDF and PPTX writers each store once.
+
+Slots whose asset is missing keep their grey placeholder.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(HERE, "..", "assets", "images")
+IMAGE_CACHE = os.path.join(HERE, ".slide-cache", "images")
+
+IMAGE_DPI = 150
+JPEG_QUALITY = 80
+# Bump when the processing below changes
+PIPELINE_VERSION = 1
+
+
+def _source_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def pixel_size(size_pt, dpi=IMAGE_DPI):
+    """Pixels needed to fill a slot of `size_pt` (width, height in points) at `dpi`."""
+    return tuple(max(1, round(v / 72 * dpi)) for v in size_pt)
+
+
+def _process(source, target, pixels):
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as im:
+        im = ImageOps.exif_transpose(im)
+        im = ImageOps.grayscale(im)
+        im = ImageOps.fit(im, pixels, Image.Resampling.LANCZOS)
+    part = f"{target}.{os.getpid()}.part"  # build-deck.py runs two builds at once
+    im.save(part, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    os.replace(part, target)
+    return target
+
+
+def prepare_images(slots, cache_dir=IMAGE_CACHE, workers=1):
+    """Prepared image files for `slots`, a list of (asset file name, slot size in points).
+
+    Returns a list in the same order: the path of the prepared JPEG, or None where the
+    asset does not exist. Images not yet in `cache_dir` are processed in `workers`
+    processes.
+    """
+    paths = []
+    todo = {}
+    hashes = {}
+    for asset, size_pt in slots:
+        source = os.path.join(ASSETS_DIR, asset)
+        if not os.path.isfile(source):
+            paths.append(None)
+            continue
+        if source not in hashes:
+            hashes[source] = _source_hash(source)
+        pixels = pixel_size(size_pt)
+        key = hashlib.sha256(f"{PIPELINE_VERSION} {hashes[source]} {pixels} {JPEG_QUALITY}".encode("utf-8")).hexdigest()[:24]
+        target = os.path.join(cache_dir, f"{os.path.splitext(asset)[0]}-{key}.jpg")
+        if not os.path.exists(target):
+            todo[target] = (source, pixels)
+        paths.append(target)
+
+    if todo:
+        os.makedirs(cache_dir, exist_ok=True)
+        if workers <= 1 or len(todo) == 1:
+            for target, (source, pixels) in todo.items():
+                _process(source, target, pixels)
+        else:
+            with ProcessPoolExecutor(min(workers, len(todo))) as pool:
+                list(pool.map(_process, [s for s, _ in todo.values()], list(todo), [p for _, p in todo.values()]))
+    return paths
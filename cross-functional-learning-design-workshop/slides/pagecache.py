@@ -0,0 +1,210 @@
+"""
+Content-hashed page cache for the slide builders.
+
+Each slide is drawn on a scratch canvas of its own and kept as the page's drawing
+operators plus the fonts they name. The cache key hashes everything the drawing can
+depend on: the layout function's code, the code of every helper it reaches (followed
+through the globals it names, into typeset.py and any other module next to the deck
+script), the values of the design tokens, constants and default arguments it reads,
+the arguments it is drawn with (the slide's content, page number and footer) and the
+reportlab version. Editing one slide's text, or one helper, therefore only invalidates
+the slides that use it; moving code or editing comments does not, as line numbers are
+left out of the hash.
+
+A page also keeps the warnings its drawing raised (text that does not fit its box, see
+typeset.fit), so a build can report them for pages it takes from the cache.
+
+Pages, cached or fresh, are spliced into the output canvas with their font references
+renamed to the output document's (see pagesplice.py) and the image files they draw
+registered with it, so a page drawn in one run (or process) can be reused in any other.
+Image files are named by their content (see images.py), so the file name in a slide's
+arguments is enough to key a page that draws it. render_all draws pages in a process
+pool on that basis. Delete the cache directory to start over.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import types
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.pdfgen import canvas as pdfcanvas
+
+import pagesplice
+
+# Bump when the cached page format changes
+CACHE_VERSION = 3
+
+
+def _names(code):
+    """Global names a code object and the code nested in it (comprehensions, lambdas) may read."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _names(const)
+    return names
+
+
+def _code_bytes(code):
+    """What a code object does, without the line numbers that shift when other code is edited."""
+    parts = [code.co_code, repr((code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars)).encode("utf-8")]
+    for const in code.co_consts:
+        parts.append(_code_bytes(const) if isinstance(const, types.CodeType) else repr(const).encode("utf-8"))
+    return b"\0".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _home(code):
+    return os.path.dirname(os.path.abspath(code.co_filename))
+
+
+def fingerprint(fn):
+    """Hash of `fn`'s code and of everything it reaches through its globals.
+
+    Functions from modules in the same directory as `fn` are followed; anything else
+    callable (reportlab, the standard library) counts by name only. Private values
+    (an underscore name that is not a function) are runtime state such as typeset.py's
+    width memo and are left out.
+    """
+    home = _home(fn.__code__)
+    h = hashlib.sha256()
+    seen = set()
+    stack = [fn]
+    while stack:
+        fn = inspect.unwrap(stack.pop())
+        if id(fn) in seen:
+            continue
+        seen.add(id(fn))
+        h.update(_code_bytes(fn.__code__))
+        h.update(repr((fn.__defaults__, fn.__kwdefaults__)).encode("utf-8"))
+        for name in sorted(_names(fn.__code__)):
+            if name not in fn.__globals__:
+                continue
+            value = fn.__globals__[name]
+            if isinstance(value, types.ModuleType) or (name.startswith("_") and not callable(value)):
+                continue
+            code = getattr(inspect.unwrap(value), "__code__", None) if callable(value) else None
+            if code is not None and _home(code) == home:
+                stack.append(value)
+            elif callable(value):
+                h.update(f"{name}={getattr(value, '__module__', '')}.{getattr(value, '__qualname__', '')}".encode("utf-8"))
+            else:
+                h.update(f"{name}={value!r}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def slide_key(fn, args, pagesize):
+    """Cache key for a page drawn by `fn(c, *args)` at `pagesize`. `args` must be JSON data."""
+    h = hashlib.sha256(f"{CACHE_VERSION} {REPORTLAB_VERSION} {fn.__name__} {pagesize!r}".encode("utf-8"))
+    h.update(json.dumps(args, sort_keys=True).encode("utf-8"))
+    h.update(fingerprint(fn).encode("ascii"))
+    return h.hexdigest()[:32]
+
+
+class _ScratchCanvas(pdfcanvas.Canvas):
+    """Canvas that records the image files drawn on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.image_files = []
+
+    def drawImage(self, image, x, y, width=None, height=None, mask=None, **kwargs):
+        # Only plain image files can be drawn again by name when the page is spliced
+        self.image_files.append(image if isinstance(image, str) and mask is None else None)
+        return super().drawImage(image, x, y, width, height, mask, **kwargs)
+
+
+def render(fn, args, pagesize):
+    """Draw one slide, `fn(c, *args)`, on a scratch canvas. Returns the page: its operators,
+    their fonts, the image files they draw and the warnings drawing it raised.
+
+    Returns None for a page that uses other resources (transparency states, forms,
+    links, in-memory or masked images), which cannot be moved between documents; draw
+    those on the output canvas directly.
+    """
+    c = _ScratchCanvas(io.BytesIO(), pagesize=pagesize)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        fn(c, *args)
+    if not pagesplice.movable(c) or None in c.image_files or len(c._formsinuse) != len(c.image_files):
+        return None
+    return dict(pagesplice.record(c), pdf_version=list(c._doc._pdfVersion), images=sorted(set(c.image_files)),
+                warnings=[str(w.message) for w in caught])
+
+
+def render_all(script, jobs, pagesize, workers=1):
+    """Pages for `jobs`, a list of (layout function, args), in the same order.
+
+    With more than one worker the slides are drawn in a process pool. Each worker loads
+    `script` (the deck's source file) itself and looks the functions up by name, so they
+    are drawn from the code on disk, not from the caller's module object.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [render(fn, args, pagesize) for fn, args in jobs]
+    with ProcessPoolExecutor(min(workers, len(jobs))) as pool:
+        return list(pool.map(_render_named, [script] * len(jobs), [fn.__name__ for fn, _ in jobs],
+                             [args for _, args in jobs], [pagesize] * len(jobs)))
+
+
+_scripts = {}  # deck script path -> module, per worker process
+
+
+def _render_named(script, name, args, pagesize):
+    module = _scripts.get(script)
+    if module is None:
+        spec = importlib.util.spec_from_file_location("_deck", script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scripts[script] = module
+    return render(getattr(module, name), args, pagesize)
+
+
+def splice(c, page):
+    """Append a rendered page to canvas `c`, with its images (see pagesplice.splice)."""
+    c._doc._pdfVersion = max(c._doc._pdfVersion, tuple(page["pdf_version"]))
+    for path in page["images"]:
+        # Registers the image with c's document (once per document) and this page; the
+        # image is named by its file name, as in the page's operators
+        mark = len(c._code)
+        c.drawImage(path, 0, 0, 1, 1)
+        del c._code[mark:]
+    pagesplice.splice(c, page)
+
+
+class PageCache:
+    """Rendered pages on disk, one JSON file per key."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                page = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not all(os.path.exists(path) for path in page.get("images", ())):
+            return None  # the image cache was cleared; draw the page again
+        return page
+
+    def put(self, key, page):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        with open(path + ".part", "w", encoding="utf-8") as f:
+            json.dump(page, f)
+        os.replace(path + ".part", path)
+
+    def load_manifest(self):
+        return self.get("manifest") or {}
+
+    def save_manifest(self, manifest):
+        self.put("manifest", manifest)
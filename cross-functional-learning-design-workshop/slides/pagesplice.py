@@ -0,0 +1,71 @@
+"""
+Moving drawn pages between reportlab documents.
+
+A page is kept as its drawing operators plus the fonts they name, {"code": [...],
+"fonts": [[ref, font name], ...]}. Operators name fonts by references local to their
+document ("/F2 13 Tf"), so splicing a page into another canvas renames each reference
+to that canvas's document's. Pages that use other document resources (transparency
+states, forms, links) cannot be moved this way; see movable().
+
+pagecache.py records and splices slides with these, and participant/workbooks.py the
+pages that follow each workbook's cover.
+"""
+
+import re
+
+from reportlab.pdfgen import canvas as pdfcanvas
+
+# Font selection in page operators, e.g. "/F2 13 Tf"
+FONT_REF = re.compile(r"/F\d+(?= [-\d.]+ Tf)")
+
+
+def record(c):
+    """The page drawn so far on canvas `c`: its operators and the fonts they name."""
+    fonts = {internal: ps for ps, internal in c._doc.fontMapping.items()}
+    used = []
+    for line in c._code:
+        for ref in FONT_REF.findall(line):
+            if ref not in used:
+                used.append(ref)
+    return {"code": list(c._code), "fonts": [[ref, fonts[ref]] for ref in used]}
+
+
+def movable(c):
+    """Whether what was drawn on canvas `c` uses no resources besides fonts and images."""
+    return not (c._extgstate._c or c._annotationrefs)
+
+
+def splice(c, page):
+    """Append a recorded page's operators to canvas `c`, renaming fonts to c's document's."""
+    names = {ref: c._doc.getInternalFontName(ps) for ref, ps in page["fonts"]}
+    c._code.extend(FONT_REF.sub(lambda m: names[m.group(0)], line) for line in page["code"])
+
+
+class RecordingCanvas(pdfcanvas.Canvas):
+    """Canvas that records each page as it is finished, in `pages`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pages = []
+
+    def showPage(self):
+        self.pages.append(record(self))
+        super().showPage()
+
+    def movable(self):
+        """Whether every page drawn so far can be spliced into another document."""
+        return movable(self) and not self._formsinuse
+
+
+class SplicingCanvas(pdfcanvas.Canvas):
+    """Canvas that adds recorded `pages` after its own when the document is saved."""
+
+    def __init__(self, *args, pages=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pages = pages
+
+    def save(self):
+        for page in self._pages:
+            splice(self, page)
+            self.showPage()
+        super().save()
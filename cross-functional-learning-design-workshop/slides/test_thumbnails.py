@@ -0,0 +1,129 @@
+"""
+Thumbnails and contact sheets.
+
+Most tests draw onto a recording stand-in for renderPM's backend (RecordingGState), so
+they run without cairo and check what the slides ask renderPM to draw. The last one
+draws real pixels and is skipped where rlPyCairo is not installed (see requirements.txt).
+Run from this folder: python -m pytest -q
+"""
+
+import importlib.util
+import os
+import types
+
+import pytest
+from reportlab.graphics import renderPM
+from reportlab.lib.colors import HexColor
+
+Image = pytest.importorskip("PIL.Image")
+
+import thumbnails
+from deck import load_deck
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location("build_slides", os.path.join(HERE, "build-slides.py"))
+slides = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(slides)
+
+PAGESIZE = (slides.SLIDE_W, slides.SLIDE_H)
+
+
+class RecordingGState:
+    """Stand-in for rlPyCairo.GState: keeps the graphics state and records every other call."""
+
+    def __init__(self, width, height, bg=None, fmt="RGB24"):
+        self.__dict__.update(width=width, height=height, _fmt=fmt, ops=[], ctm=(1, 0, 0, 1, 0, 0),
+                             fillColor=None, strokeColor=None, strokeWidth=1, lineCap=0, lineJoin=0,
+                             dashArray=None, fillMode=0, fontName="Helvetica", fontSize=10)
+
+    def setFont(self, fontName, fontSize):
+        self.fontName, self.fontSize = fontName, fontSize
+
+    @property
+    def pixBuf(self):
+        return b"\xff" * (self.width * self.height * 3)
+
+    def __getattr__(self, name):
+        return lambda *args: self.ops.append((name, args))
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    monkeypatch.setattr(renderPM, "_getPMBackend", lambda backend=None: types.SimpleNamespace(GState=RecordingGState))
+    # reportlab.graphics.utils.setFont, which without freetype is a stub that raises
+    monkeypatch.setattr(renderPM, "_setFont", lambda gs, fontName, fontSize: gs.setFont(fontName, fontSize))
+
+
+def _ops(c):
+    return c._gs.ops
+
+
+def test_every_slide_draws(recording):
+    deck = load_deck()
+    for s in deck["slides"]:
+        c = thumbnails.thumbnail_canvas(PAGESIZE)
+        slides.LAYOUTS[s["type"]](c, s)
+        names = [name for name, _ in _ops(c)]
+        assert "pathFill" in names, s["id"]
+        assert "drawString" in names, s["id"]
+
+
+def test_image_is_drawn_and_state_kept(recording, tmp_path):
+    photo = str(tmp_path / "photo.png")
+    Image.new("RGB", (40, 20), (200, 30, 30)).save(photo)
+    c = thumbnails.thumbnail_canvas(PAGESIZE)
+    c.setFillColor(HexColor("#123456"))
+    c.setStrokeColor(HexColor("#654321"))
+    c.setLineWidth(3)
+    c.setFont("Helvetica-Bold", 17)
+    before = {name: getattr(c, name) for name in thumbnails.DRAW_STATE}
+
+    c.drawImage(photo, 10, 20, 300, 150)
+
+    (args,) = [args for name, args in _ops(c) if name == "_aapixbuf"]
+    assert args[:4] == (10, 20, 300, 150)
+    assert args[5:] == (40, 20, 3)
+    assert {name: getattr(c, name) for name in thumbnails.DRAW_STATE} == before
+    assert (c.fontName, c.fontSize) == ("Helvetica-Bold", 17)
+
+
+def test_phase_slide_draws_its_photo(recording, tmp_path):
+    photo = str(tmp_path / "photo.png")
+    Image.new("RGB", (40, 20)).save(photo)
+    s = next(s for s in load_deck()["slides"] if s["type"] == "phase")
+    c = thumbnails.thumbnail_canvas(PAGESIZE)
+    slides.LAYOUTS["phase"](c, dict(s, image_file=photo))
+    assert [name for name, _ in _ops(c)].count("_aapixbuf") == 1
+
+
+def test_contact_sheet_layout_and_cache(recording, tmp_path, capsys):
+    deck = load_deck()
+    sheet = str(tmp_path / "contact.png")
+    slides.build_thumbnails(sheet, deck, cache_dir=str(tmp_path / "cache"))
+    assert f"({len(deck['slides'])} drawn, 0 from cache)" in capsys.readouterr().out
+
+    w = round(slides.SLIDE_W * thumbnails.THUMB_DPI / 72)
+    h = round(slides.SLIDE_H * thumbnails.THUMB_DPI / 72)
+    rows = -(-len(deck["slides"]) // thumbnails.SHEET_COLUMNS)
+    gap = thumbnails.SHEET_GAP
+    with Image.open(sheet) as im:
+        assert im.size == (gap + thumbnails.SHEET_COLUMNS * (w + gap), gap + rows * (h + gap))
+        assert im.getpixel((0, 0)) == thumbnails.SHEET_BG
+        assert im.getpixel((gap + w // 2, gap + h // 2)) == (255, 255, 255)
+
+    slides.build_thumbnails(sheet, deck, cache_dir=str(tmp_path / "cache"))
+    assert f"(0 drawn, {len(deck['slides'])} from cache)" in capsys.readouterr().out
+
+
+def test_contact_sheet_pixels(tmp_path, capsys):
+    pytest.importorskip("rlPyCairo")
+    deck = load_deck()
+    sheet = str(tmp_path / "contact.png")
+    slides.build_thumbnails(sheet, deck, cache_dir=str(tmp_path / "cache"))
+    assert f"({len(deck['slides'])} drawn, 0 from cache)" in capsys.readouterr().out
+    gap = thumbnails.SHEET_GAP
+    w = round(slides.SLIDE_W * thumbnails.THUMB_DPI / 72)
+    h = round(slides.SLIDE_H * thumbnails.THUMB_DPI / 72)
+    with Image.open(sheet) as im:
+        # The first slide is drawn, not left as the background
+        assert im.getpixel((gap + w // 2, gap + h // 2)) != thumbnails.SHEET_BG
@@ -0,0 +1,116 @@
+"""
+Low-resolution PNG thumbnails of slides, laid out as a contact sheet.
+
+The slide layouts draw straight onto a reportlab renderPM canvas (ThumbnailCanvas
+accepts the pdfgen call signatures they use), so a thumbnail needs no PDF renderer.
+Thumbnails are kept in the slide cache directory under the page's content-hash key
+(see pagecache.py) and the resolution, so only changed slides are redrawn.
+
+Install: pip install -r requirements.txt (rlPyCairo and freetype-py, renderPM's drawing
+backend; it needs the cairo library). test_thumbnails.py checks the drawing against a
+recording stand-in for that backend, and draws a real contact sheet where it is installed.
+"""
+
+import os
+
+# Resolution of a thumbnail; the 338 x 190 mm slide comes out at 266 x 150 px
+THUMB_DPI = 20
+SHEET_COLUMNS = 6
+SHEET_GAP = 12  # px, between and around thumbnails
+SHEET_BG = (208, 208, 208)  # grey, so white slides stand out
+# Canvas state that renderPM.draw() resets to a drawing's defaults, besides the font
+DRAW_STATE = ("ctm", "strokeWidth", "strokeColor", "lineCap", "lineJoin", "dashArray", "fillColor", "fillMode")
+
+
+def _pm():
+    try:
+        from reportlab.graphics import renderPM
+        renderPM._getPMBackend()
+    except Exception as e:
+        raise RuntimeError("Thumbnails need renderPM's backend: pip install rlPyCairo freetype-py") from e
+    return renderPM
+
+
+def thumbnail_canvas(pagesize, dpi=THUMB_DPI):
+    """A renderPM canvas the size of one slide at `dpi` that takes pdfgen-style calls."""
+    renderPM = _pm()
+
+    class ThumbnailCanvas(renderPM.PMCanvas):
+        # pdfgen fills nothing unless asked, renderPM fills by default; renderPM's
+        # roundRect, circle and drawRightString take different arguments; and it has no
+        # drawImage, so images go through renderPM.draw as a one-image drawing (image
+        # files only, as images.py writes them)
+
+        def rect(self, x, y, width, height, stroke=1, fill=0):
+            super().rect(x, y, width, height, stroke=stroke, fill=fill)
+
+        def roundRect(self, x, y, width, height, radius, stroke=1, fill=0):
+            x2, y2, r = x + width, y + height, radius
+            self.pathBegin()
+            self.moveTo(x + r, y)
+            self.addEllipsoidalArc(x2 - r, y + r, r, r, 270, 360)
+            self.addEllipsoidalArc(x2 - r, y2 - r, r, r, 0, 90)
+            self.addEllipsoidalArc(x + r, y2 - r, r, r, 90, 180)
+            self.addEllipsoidalArc(x + r, y + r, r, r, 180, 270)
+            self.pathClose()
+            self.fillstrokepath(stroke=stroke, fill=fill)
+
+        def circle(self, x, y, r, stroke=1, fill=0):
+            self.ellipse(x, y, r, r)
+            self.fillstrokepath(stroke=stroke, fill=fill)
+
+        def drawRightString(self, x, y, text):
+            self.drawString(x, y, text, text_anchor="end")
+
+        def drawImage(self, image, x, y, width=None, height=None, **kwargs):
+            from reportlab.graphics.shapes import Drawing, Image
+
+            state = {name: getattr(self, name) for name in DRAW_STATE}
+            font = self.fontName, self.fontSize
+            renderPM.draw(Drawing(pagesize[0], pagesize[1], Image(x, y, width, height, image)), self, 0, 0)
+            for name, value in state.items():
+                setattr(self, name, value)
+            self.setFont(*font)
+
+    return ThumbnailCanvas(pagesize[0], pagesize[1], dpi=dpi)
+
+
+def thumbnail(fn, args, pagesize, dpi=THUMB_DPI):
+    """Draw `fn(c, *args)` as a PIL image."""
+    c = thumbnail_canvas(pagesize, dpi)
+    fn(c, *args)
+    return c.toPIL()
+
+
+def contact_sheet(path, jobs, keys, pagesize, cache_dir=None, dpi=THUMB_DPI, columns=SHEET_COLUMNS):
+    """Write a PNG of thumbnails for `jobs` ((layout function, args) pairs) to `path`.
+
+    `keys` are the jobs' page cache keys; with a `cache_dir`, thumbnails already drawn
+    for a key are read back rather than drawn. Returns how many were drawn.
+    """
+    from PIL import Image
+
+    images = []
+    drawn = 0
+    for (fn, args), key in zip(jobs, keys):
+        cached = os.path.join(cache_dir, f"{key}.{dpi}.png") if cache_dir else None
+        if cached and os.path.exists(cached):
+            with Image.open(cached) as im:
+                images.append(im.convert("RGB"))
+            continue
+        im = thumbnail(fn, args, pagesize, dpi).convert("RGB")
+        drawn += 1
+        if cached:
+            os.makedirs(cache_dir, exist_ok=True)
+            im.save(cached + ".part", "PNG")
+            os.replace(cached + ".part", cached)
+        images.append(im)
+
+    w, h = images[0].size
+    rows = -(-len(images) // columns)
+    sheet = Image.new("RGB", (SHEET_GAP + min(columns, len(images)) * (w + SHEET_GAP), SHEET_GAP + rows * (h + SHEET_GAP)),
+                      SHEET_BG)
+    for i, im in enumerate(images):
+        sheet.paste(im, (SHEET_GAP + (i % columns) * (w + SHEET_GAP), SHEET_GAP + (i // columns) * (h + SHEET_GAP)))
+    sheet.save(path, "PNG")
+    return drawn
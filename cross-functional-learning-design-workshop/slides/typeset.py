@@ -0,0 +1,105 @@
+"""
+Text measurement and word-wrap shared by the slide builders.
+
+Widths come from reportlab's font metrics, memoised per (font, size) and per word. A
+line's width is the sum of its words' widths plus the spaces between them (standard
+PDF font metrics are additive, so this matches measuring the joined line), so wrapping
+is linear in the length of the text. Finished wraps are kept in an LRU cache keyed by
+text, font, size and width, so a deck that wraps the same copy again (several builds,
+deck variants, PDF and preview passes) pays for it once.
+
+fit picks the largest size on a type scale at which text fits a box: it wraps at each
+size from the top of the scale down and stops at the first that fits, so a search is a
+few cached wraps. Text that fits at no size is flagged with a TextOverflow warning
+(the page cache keeps these with the page, so builds report them even for pages they
+do not redraw).
+"""
+
+import warnings
+from collections import namedtuple
+from functools import lru_cache
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Wrapped paragraphs kept; a full deck wraps a few hundred
+WRAP_CACHE_SIZE = 4096
+
+_widths = {}  # (font, size) -> {word: width in points}
+
+Fit = namedtuple("Fit", "size leading lines fits")
+
+
+class TextOverflow(UserWarning):
+    """Text that does not fit its box at any size on the type scale."""
+
+
+def word_width(word, font, size):
+    """Width of `word` in points, measured once per font and size."""
+    widths = _widths.get((font, size))
+    if widths is None:
+        widths = _widths.setdefault((font, size), {})
+    width = widths.get(word)
+    if width is None:
+        width = widths[word] = stringWidth(word, font, size)
+    return width
+
+
+def text_width(text, font, size):
+    """Width of single-spaced text, from cached word widths."""
+    words = text.split(" ")
+    return sum(word_width(w, font, size) for w in words) + (len(words) - 1) * word_width(" ", font, size)
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap(text, font, size, max_w):
+    """Greedy word-wrap of `text` to lines at most `max_w` points wide. Returns a tuple of lines.
+
+    Runs of whitespace collapse to one space; a word wider than `max_w` gets a line of
+    its own.
+    """
+    space = word_width(" ", font, size)
+    lines, current, width = [], [], 0.0
+    for word in text.split():
+        w = word_width(word, font, size)
+        if current and width + space + w > max_w:
+            lines.append(" ".join(current))
+            current, width = [word], w
+        else:
+            width = width + space + w if current else w
+            current.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
+
+def block_height(lines, size, leading):
+    """Height of a block of lines: one line's size plus a leading per further line."""
+    return size + (len(lines) - 1) * leading
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _fit(text, font, scale, max_w, max_h):
+    if not scale:
+        raise ValueError("empty type scale")
+    for size, leading in scale:
+        lines = wrap(text, font, size, max_w) if max_h is not None else (text,)
+        if (all(text_width(line, font, size) <= max_w for line in lines)
+                and (max_h is None or block_height(lines, size, leading) <= max_h)):
+            return Fit(size, leading, lines, True)
+    return Fit(size, leading, lines, False)
+
+
+def fit(text, font, scale, max_w, max_h=None):
+    """Largest (size, leading) in `scale` at which `text` fits a box `max_w` by `max_h` points.
+
+    `scale` is a tuple of (size, leading) pairs, largest first. With `max_h` the text is
+    wrapped to the box; without, it must fit on one line. Returns a Fit of the size,
+    leading and lines to draw. If no size fits, warns with TextOverflow and returns the
+    smallest size, with fits=False.
+    """
+    result = _fit(text, font, scale, max_w, max_h)
+    if not result.fits:
+        box = f"{max_w:.0f} pt wide" if max_h is None else f"{max_w:.0f} x {max_h:.0f} pt"
+        short = text if len(text) <= 40 else text[:37] + "..."
+        warnings.warn(TextOverflow(f"{short!r} does not fit {box} even at {result.size} pt"), stacklevel=2)
+    return result